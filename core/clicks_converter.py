@@ -4,8 +4,9 @@ Uses linear interpolation based on car-specific data.
 """
 
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -290,6 +291,52 @@ class ClicksConverter:
         return int(round(percentage))
 
 
+@lru_cache(maxsize=512)
+def _classify_param_name(param_name: str) -> Optional[str]:
+    """
+    Determine parameter type from an AC parameter name.
+    
+    Memoized: the set of parameter names across setups is small, so each
+    name's substring checks run once.
+    """
+    param_upper = param_name.upper()
+    
+    if "PRESSURE" in param_upper:
+        return "pressure"
+    if "CAMBER" in param_upper:
+        return "camber"
+    if "TOE" in param_upper:
+        return "toe"
+    if "SPRING" in param_upper or "ROD_LENGTH" in param_upper:
+        return "spring"
+    if "FAST_BUMP" in param_upper:
+        return "damper_fast_bump"
+    if "FAST_REBOUND" in param_upper:
+        return "damper_fast_rebound"
+    if "BUMP" in param_upper:
+        return "damper_bump"
+    if "REBOUND" in param_upper:
+        return "damper_rebound"
+    if "ARB" in param_upper or "ANTIROLL" in param_upper or "SWAY" in param_upper:
+        return "arb"
+    if "WING" in param_upper or "AERO" in param_upper or "SPLITTER" in param_upper or "SPOILER" in param_upper:
+        return "wing"
+    if "HEIGHT" in param_upper or "PACKER" in param_upper:
+        return "ride_height"
+    if "POWER" in param_upper and "BRAKE" not in param_upper:
+        return "diff"
+    if "COAST" in param_upper:
+        return "diff"
+    if "PRELOAD" in param_upper:
+        return "diff"
+    if "BIAS" in param_upper or "BALANCE" in param_upper:
+        return "brake_bias"
+    if "BRAKE" in param_upper:
+        return "brake_bias"
+    
+    return None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # SMART CONVERTER - Combines detection and conversion
 # ═══════════════════════════════════════════════════════════════════════════
@@ -424,41 +471,29 @@ class SmartConverter:
         # Default - return as-is
         return int(round(physical_value)), f"Default conversion: {physical_value} → {int(round(physical_value))}"
     
+    def detect_and_convert_many(
+        self,
+        car_id: str,
+        category: str,
+        items: List[Tuple[str, float, Optional[int]]]
+    ) -> List[Tuple[int, str]]:
+        """
+        Convert several parameters of one car in a single call.
+        
+        Args:
+            car_id: Car identifier
+            category: Car category (gt, formula, street, etc.)
+            items: (param_name, physical_value, existing_value) per parameter
+        
+        Returns:
+            List of (converted_value, conversion_log), in the order of items
+        """
+        convert = self.detect_and_convert
+        return [
+            convert(car_id, category, param_name, physical_value, existing_value)
+            for param_name, physical_value, existing_value in items
+        ]
+    
     def _get_param_type(self, param_name: str) -> Optional[str]:
         """Determine parameter type from name."""
-        param_upper = param_name.upper()
-        
-        if "PRESSURE" in param_upper:
-            return "pressure"
-        if "CAMBER" in param_upper:
-            return "camber"
-        if "TOE" in param_upper:
-            return "toe"
-        if "SPRING" in param_upper or "ROD_LENGTH" in param_upper:
-            return "spring"
-        if "FAST_BUMP" in param_upper:
-            return "damper_fast_bump"
-        if "FAST_REBOUND" in param_upper:
-            return "damper_fast_rebound"
-        if "BUMP" in param_upper:
-            return "damper_bump"
-        if "REBOUND" in param_upper:
-            return "damper_rebound"
-        if "ARB" in param_upper or "ANTIROLL" in param_upper or "SWAY" in param_upper:
-            return "arb"
-        if "WING" in param_upper or "AERO" in param_upper or "SPLITTER" in param_upper or "SPOILER" in param_upper:
-            return "wing"
-        if "HEIGHT" in param_upper or "PACKER" in param_upper:
-            return "ride_height"
-        if "POWER" in param_upper and "BRAKE" not in param_upper:
-            return "diff"
-        if "COAST" in param_upper:
-            return "diff"
-        if "PRELOAD" in param_upper:
-            return "diff"
-        if "BIAS" in param_upper or "BALANCE" in param_upper:
-            return "brake_bias"
-        if "BRAKE" in param_upper:
-            return "brake_bias"
-        
-        return None
+        return _classify_param_name(param_name)
@@ -119,7 +119,9 @@ class DynamicMapper:
         self._cache: Dict[str, Dict[str, str]] = {}  # car_id -> mapping
     
     def set_setups_path(self, path: Path):
-        """Set the setups path."""
+        """Set the setups path (drops mappings detected under the old path)."""
+        if path != self.setups_path:
+            self._cache.clear()
         self.setups_path = path
     
     def get_car_mapping(self, car_id: str, force_refresh: bool = False) -> Dict[str, str]:
@@ -397,6 +399,8 @@ class ValueTypeDetector:
         self._cache: Dict[str, Dict[str, str]] = {}  # car_id -> {param: "clicks"|"absolute"}
     
     def set_setups_path(self, path: Path):
+        if path != self.setups_path:
+            self._cache.clear()
         self.setups_path = path
     
     def detect_value_types(self, car_id: str) -> Dict[str, str]:
@@ -473,7 +477,7 @@ class ValueTypeDetector:
         # Parse it
         try:
             content = setup_file.read_text(encoding="utf-8")
-        except:
+        except (OSError, UnicodeDecodeError):
             return values
         
         current_section = None
@@ -482,11 +486,11 @@ class ValueTypeDetector:
             if line.startswith("[") and line.endswith("]"):
                 current_section = line[1:-1]
             elif line.startswith("VALUE=") and current_section:
-                try:
-                    value = int(line.split("=")[1])
-                    values[current_section] = value
-                except:
-                    pass
+                # Check the digits up front instead of catching ValueError
+                text = line[6:].partition("=")[0].strip()
+                digits = text[1:] if text[:1] in ("-", "+") else text
+                if digits.isdecimal():
+                    values[current_section] = int(text)
         
         return values
     
@@ -6,6 +6,7 @@ Tracks calculations, conversions, clamping, and ignored parameters.
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any
+import copy
 import json
 
 
@@ -21,20 +22,21 @@ class SetupDebugLogger:
     - Final exported values
     """
     
-    def __init__(self, log_path: Optional[Path] = None):
+    def __init__(self, log_path: Optional[Path] = None, prefix: str = "debug_setup"):
         """
         Initialize debug logger.
         
         Args:
-            log_path: Path to log file (default: debug_setup_TIMESTAMP.log)
+            log_path: Path to log file (default: PREFIX_TIMESTAMP.log)
+            prefix: File name prefix used when log_path is not given
         """
+        self.start_time = datetime.now()
+        
         if log_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_path = Path(f"debug_setup_{timestamp}.log")
+            log_path = Path(f"{prefix}_{self.start_time:%Y%m%d_%H%M%S}.log")
         
         self.log_path = Path(log_path)
         self.entries = []
-        self.start_time = datetime.now()
         
         # Metadata
         self.car_id = None
@@ -304,6 +306,17 @@ class SetupDebugLogger:
         
         return json.dumps(data, indent=2)
     
+    def snapshot(self) -> "SetupDebugLogger":
+        """
+        Copy of this logger with its own entry list.
+        
+        Later log calls on this logger do not affect the copy, so it can be
+        saved from another thread.
+        """
+        snap = copy.copy(self)
+        snap.entries = list(self.entries)
+        return snap
+    
     def save(self, format: str = "text"):
         """
         Save log to file.
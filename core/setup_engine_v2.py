@@ -3,11 +3,13 @@ Setup Engine V2 - Physics-Based Expert System
 Complete rewrite with granular classification, dynamic tire pressure, and accurate physics calculations.
 """
 
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, List, Sequence
 from pathlib import Path
 import configparser
+import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from models.setup import Setup, SetupSection
 from models.driver_profile import DriverProfile
 from models.car import Car
@@ -16,12 +18,64 @@ from core.behavior_engine import BehaviorEngine, Behavior
 from core.rules_engine import RulesEngine
 from core.scoring_engine import ScoringEngine, ScoreBreakdown
 
+log = logging.getLogger(__name__)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # PHYSICAL CONSTANTS & TARGETS
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+def angular_frequency_sq(frequency: float) -> float:
+    """Squared angular frequency (2πf)² for a natural frequency in Hz."""
+    return (2 * math.pi * frequency) ** 2
+
+
+def spring_rate_from_omega_sq(
+    omega_sq: float,
+    corner_weight_kg: float,
+    motion_ratio: float = 1.0
+) -> float:
+    """
+    Spring rate (N/m) from a precomputed squared angular frequency.
+    
+    k_wheel = ω² * m, k_spring = k_wheel * MR²
+    """
+    return omega_sq * corner_weight_kg * (motion_ratio ** 2)
+
+
+def damping_coefficients(
+    spring_rate: float,
+    corner_weight_kg: float,
+    bump_rebound_ratio: float,
+    fast_slow_ratio: float
+) -> Tuple[float, float, float, float]:
+    """
+    Split damping into (bump, rebound, fast_bump, fast_rebound) in N·s/m.
+    
+    Uses 70% of critical damping c = 2 * sqrt(k * m), split so that
+    rebound = bump * bump_rebound_ratio and fast = slow * fast_slow_ratio.
+    """
+    # Critical damping coefficient
+    c_critical = 2 * math.sqrt(spring_rate * corner_weight_kg)
+    
+    # Use 70% of critical damping as baseline (typical for race cars)
+    damping_coefficient = 0.7 * c_critical
+    
+    # Split into bump and rebound based on ratio
+    # If ratio is 2.5:1, then rebound = 2.5 * bump
+    # Total = bump + rebound = bump * (1 + ratio)
+    # So: bump = total / (1 + ratio)
+    bump = damping_coefficient / (1 + bump_rebound_ratio)
+    rebound = bump * bump_rebound_ratio
+    
+    # Fast damping is higher than slow
+    fast_bump = bump * fast_slow_ratio
+    fast_rebound = rebound * fast_slow_ratio
+    
+    return bump, rebound, fast_bump, fast_rebound
+
+
+@dataclass(frozen=True)
 class PhysicalTargets:
     """Physical targets for a car category."""
     
@@ -62,6 +116,14 @@ class PhysicalTargets:
     
     # Brake bias (% front)
     brake_bias: float
+    
+    # Derived: squared angular frequency (2πf)², computed once per category
+    omega_front_sq: float = field(init=False, repr=False)
+    omega_rear_sq: float = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "omega_front_sq", angular_frequency_sq(self.front_frequency))
+        object.__setattr__(self, "omega_rear_sq", angular_frequency_sq(self.rear_frequency))
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -373,6 +435,126 @@ CATEGORY_TARGETS = {
 }
 
 
+# Laps needed for tires to reach their hot target pressure
+LAPS_TO_OPTIMAL = 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SETUP SECTION LAYOUT
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Fixed layout of generated setup values: section → keys, in emission order.
+# Every key listed here is always produced by SetupEngineV2.
+SETUP_VALUE_LAYOUT = {
+    "TYRES": (
+        "PRESSURE_LF", "PRESSURE_RF", "PRESSURE_LR", "PRESSURE_RR",
+        "COMPOUND",
+    ),
+    "SUSPENSION": (
+        "SPRING_RATE_LF", "SPRING_RATE_RF", "SPRING_RATE_LR", "SPRING_RATE_RR",
+        "DAMP_BUMP_LF", "DAMP_BUMP_RF", "DAMP_BUMP_LR", "DAMP_BUMP_RR",
+        "DAMP_REBOUND_LF", "DAMP_REBOUND_RF", "DAMP_REBOUND_LR", "DAMP_REBOUND_RR",
+        "DAMP_FAST_BUMP_LF", "DAMP_FAST_BUMP_RF", "DAMP_FAST_BUMP_LR", "DAMP_FAST_BUMP_RR",
+        "DAMP_FAST_REBOUND_LF", "DAMP_FAST_REBOUND_RF", "DAMP_FAST_REBOUND_LR", "DAMP_FAST_REBOUND_RR",
+        "RIDE_HEIGHT_LF", "RIDE_HEIGHT_RF", "RIDE_HEIGHT_LR", "RIDE_HEIGHT_RR",
+    ),
+    "ALIGNMENT": (
+        "CAMBER_LF", "CAMBER_RF", "CAMBER_LR", "CAMBER_RR",
+        "TOE_LF", "TOE_RF", "TOE_LR", "TOE_RR",
+        "CASTER_LF", "CASTER_RF",
+    ),
+    "DIFFERENTIAL": ("DIFF_POWER", "DIFF_COAST", "DIFF_PRELOAD"),
+    "ARB": ("ARB_FRONT", "ARB_REAR"),
+    "BRAKES": ("BRAKE_BIAS", "FRONT_BIAS", "BRAKE_POWER_MULT"),
+    "AERO": ("WING_FRONT", "WING_REAR", "SPLITTER", "REAR_WING"),
+    "FUEL": ("FUEL",),
+}
+
+# Every layout key in emission order, copied per setup so the values dict
+# starts at its final size instead of growing while pressures and base
+# values are merged in.
+_SETUP_VALUE_TEMPLATE = dict.fromkeys(
+    key for keys in SETUP_VALUE_LAYOUT.values() for key in keys
+)
+
+
+def _corner_dict(prefix: str, front: float, rear: float) -> Dict[str, float]:
+    """Build the four LF/RF/LR/RR entries for a symmetric front/rear value."""
+    return {
+        f"{prefix}_LF": front,
+        f"{prefix}_RF": front,
+        f"{prefix}_LR": rear,
+        f"{prefix}_RR": rear,
+    }
+
+
+@lru_cache(maxsize=256)
+def _classify_car_cached(
+    car_id: str,
+    name: str,
+    car_class: str,
+    power_hp: int,
+    weight_kg: int,
+    is_drift_car: bool
+) -> str:
+    """
+    Category classification from the car attributes it depends on.
+    
+    Cached on those attributes so repeated generations for the same car
+    (V2.2 classifies before delegating to V2) skip the pattern scans.
+    """
+    car_id = car_id.lower()
+    car_name = name.lower() if name else ""
+    car_class = car_class.lower() if car_class else ""
+    
+    # 1. DRIFT (highest priority)
+    if is_drift_car or "drift" in car_id or "drift" in car_name:
+        return "drift"
+    
+    # 2. FORMULA
+    formula_patterns = ["formula", "f1", "f2", "f3", "f4", "rss_formula", "fia_f"]
+    if any(p in car_id or p in car_name or p in car_class for p in formula_patterns):
+        return "formula"
+    
+    # 3. PROTOTYPE
+    proto_patterns = ["lmp", "lmp1", "lmp2", "lmp3", "prototype", "p1", "p2"]
+    if any(p in car_id or p in car_name or p in car_class for p in proto_patterns):
+        return "prototype"
+    
+    # 4. GT (GT3, GTE, GT4)
+    gt_patterns = ["gt3", "gt2", "gt4", "gte", "gtc", "gt1", "dtm", "tcr"]
+    if any(p in car_id or p in car_name or p in car_class for p in gt_patterns):
+        return "gt"
+    
+    # 5. VINTAGE (check year or classic patterns)
+    vintage_patterns = ["vintage", "classic", "historic", "1960", "1970", "60s", "70s"]
+    if any(p in car_id or p in car_name for p in vintage_patterns):
+        return "vintage"
+    
+    # Check power/weight for vintage (low power, heavy)
+    if power_hp > 0 and weight_kg > 0:
+        power_to_weight = power_hp / weight_kg
+        if power_to_weight < 0.15 and power_hp < 250:  # <150hp/ton, <250hp
+            return "vintage"
+    
+    # 6. STREET SPORT (high-performance street cars)
+    sport_patterns = ["gt4", "m3", "m4", "m5", "rs", "gtr", "911", "cayman", "boxster", 
+                     "corvette", "viper", "amg", "type_r", "sti", "evo"]
+    if any(p in car_id or p in car_name for p in sport_patterns):
+        # Check if it's a proper sport car (>250hp, <1500kg)
+        if power_hp > 250 and weight_kg < 1500:
+            return "street_sport"
+    
+    # Check power/weight for street sport (250-400hp/ton)
+    if power_hp > 0 and weight_kg > 0:
+        power_to_weight = power_hp / weight_kg
+        if 0.25 <= power_to_weight <= 0.45:
+            return "street_sport"
+    
+    # 7. STREET (default for Touge/normal cars)
+    return "street"
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN SETUP ENGINE V2
 # ═══════════════════════════════════════════════════════════════════════════
@@ -400,56 +582,10 @@ class SetupEngineV2:
         if not car:
             return "street"
         
-        car_id = car.car_id.lower()
-        car_name = car.name.lower() if car.name else ""
-        car_class = car.car_class.lower() if car.car_class else ""
-        
-        # 1. DRIFT (highest priority)
-        if car.is_drift_car() or "drift" in car_id or "drift" in car_name:
-            return "drift"
-        
-        # 2. FORMULA
-        formula_patterns = ["formula", "f1", "f2", "f3", "f4", "rss_formula", "fia_f"]
-        if any(p in car_id or p in car_name or p in car_class for p in formula_patterns):
-            return "formula"
-        
-        # 3. PROTOTYPE
-        proto_patterns = ["lmp", "lmp1", "lmp2", "lmp3", "prototype", "p1", "p2"]
-        if any(p in car_id or p in car_name or p in car_class for p in proto_patterns):
-            return "prototype"
-        
-        # 4. GT (GT3, GTE, GT4)
-        gt_patterns = ["gt3", "gt2", "gt4", "gte", "gtc", "gt1", "dtm", "tcr"]
-        if any(p in car_id or p in car_name or p in car_class for p in gt_patterns):
-            return "gt"
-        
-        # 5. VINTAGE (check year or classic patterns)
-        vintage_patterns = ["vintage", "classic", "historic", "1960", "1970", "60s", "70s"]
-        if any(p in car_id or p in car_name for p in vintage_patterns):
-            return "vintage"
-        
-        # Check power/weight for vintage (low power, heavy)
-        if car.power_hp > 0 and car.weight_kg > 0:
-            power_to_weight = car.power_hp / car.weight_kg
-            if power_to_weight < 0.15 and car.power_hp < 250:  # <150hp/ton, <250hp
-                return "vintage"
-        
-        # 6. STREET SPORT (high-performance street cars)
-        sport_patterns = ["gt4", "m3", "m4", "m5", "rs", "gtr", "911", "cayman", "boxster", 
-                         "corvette", "viper", "amg", "type_r", "sti", "evo"]
-        if any(p in car_id or p in car_name for p in sport_patterns):
-            # Check if it's a proper sport car (>250hp, <1500kg)
-            if car.power_hp > 250 and car.weight_kg < 1500:
-                return "street_sport"
-        
-        # Check power/weight for street sport (250-400hp/ton)
-        if car.power_hp > 0 and car.weight_kg > 0:
-            power_to_weight = car.power_hp / car.weight_kg
-            if 0.25 <= power_to_weight <= 0.45:
-                return "street_sport"
-        
-        # 7. STREET (default for Touge/normal cars)
-        return "street"
+        return _classify_car_cached(
+            car.car_id, car.name, car.car_class,
+            car.power_hp, car.weight_kg, car.is_drift_car()
+        )
     
     # ═══════════════════════════════════════════════════════════════════════
     # 2. DYNAMIC TIRE PRESSURE MODULE
@@ -461,7 +597,7 @@ class SetupEngineV2:
         ambient_temp: float, 
         road_temp: float,
         pressure_gain_per_lap: float,
-        laps_to_optimal: int = 3
+        laps_to_optimal: int = LAPS_TO_OPTIMAL
     ) -> float:
         """
         Calculate cold (starting) tire pressure to reach hot target after N laps.
@@ -481,26 +617,47 @@ class SetupEngineV2:
         Returns:
             Cold starting pressure (PSI)
         """
-        # Base calculation: subtract expected gain
+        road_adjustment, ambient_adjustment = self._temperature_compensation(ambient_temp, road_temp)
         total_gain = pressure_gain_per_lap * laps_to_optimal
-        cold_pressure = hot_target - total_gain
         
-        # Temperature compensation
+        return self._cold_pressure(hot_target, total_gain, road_adjustment, ambient_adjustment)
+    
+    def _temperature_compensation(self, ambient_temp: float, road_temp: float) -> Tuple[float, float]:
+        """
+        Cold-pressure compensation (PSI) for road and ambient temperature.
+        
+        Returns:
+            Tuple of (road_adjustment, ambient_adjustment), added to the cold pressure
+        """
         # If road is cold (<20°C), tires heat slower → need higher starting pressure
         if road_temp < 20:
-            temp_deficit = 20 - road_temp
-            cold_pressure += temp_deficit * 0.075  # +0.075 PSI per °C below 20°C
-        
+            road_adjustment = (20 - road_temp) * 0.075  # +0.075 PSI per °C below 20°C
         # If road is hot (>35°C), tires heat faster → need lower starting pressure
         elif road_temp > 35:
-            temp_excess = road_temp - 35
-            cold_pressure -= temp_excess * 0.05  # -0.05 PSI per °C above 35°C
+            road_adjustment = -((road_temp - 35) * 0.05)  # -0.05 PSI per °C above 35°C
+        else:
+            road_adjustment = 0.0
         
         # Ambient temperature also affects (less impact than road)
         if ambient_temp < 15:
-            cold_pressure += (15 - ambient_temp) * 0.03
+            ambient_adjustment = (15 - ambient_temp) * 0.03
         elif ambient_temp > 30:
-            cold_pressure -= (ambient_temp - 30) * 0.02
+            ambient_adjustment = -((ambient_temp - 30) * 0.02)
+        else:
+            ambient_adjustment = 0.0
+        
+        return road_adjustment, ambient_adjustment
+    
+    def _cold_pressure(
+        self,
+        hot_target: float,
+        total_gain: float,
+        road_adjustment: float,
+        ambient_adjustment: float
+    ) -> float:
+        """Apply expected gain and temperature compensation to a hot target."""
+        # Base calculation: subtract expected gain, then compensate for temperature
+        cold_pressure = hot_target - total_gain + road_adjustment + ambient_adjustment
         
         # Clamp to reasonable range (18-35 PSI)
         cold_pressure = max(18.0, min(35.0, cold_pressure))
@@ -521,19 +678,15 @@ class SetupEngineV2:
         """
         targets = CATEGORY_TARGETS[category]
         
-        # Calculate cold pressures
-        cold_front = self.calculate_cold_pressure(
-            targets.hot_pressure_front,
-            ambient_temp,
-            road_temp,
-            targets.pressure_gain_per_lap
-        )
+        # Conditions are shared by all four corners: compensate once
+        road_adjustment, ambient_adjustment = self._temperature_compensation(ambient_temp, road_temp)
+        total_gain = targets.pressure_gain_per_lap * LAPS_TO_OPTIMAL
         
-        cold_rear = self.calculate_cold_pressure(
-            targets.hot_pressure_rear,
-            ambient_temp,
-            road_temp,
-            targets.pressure_gain_per_lap
+        cold_front = self._cold_pressure(
+            targets.hot_pressure_front, total_gain, road_adjustment, ambient_adjustment
+        )
+        cold_rear = self._cold_pressure(
+            targets.hot_pressure_rear, total_gain, road_adjustment, ambient_adjustment
         )
         
         return {
@@ -569,17 +722,11 @@ class SetupEngineV2:
         Returns:
             Spring rate in N/m
         """
-        # Convert frequency to angular frequency
-        omega = 2 * math.pi * target_frequency
-        
-        # Calculate spring rate at wheel
-        k_wheel = (omega ** 2) * corner_weight_kg
-        
-        # Convert to spring rate (accounting for motion ratio)
-        # k_spring = k_wheel * (motion_ratio)²
-        k_spring = k_wheel * (motion_ratio ** 2)
-        
-        return k_spring
+        return spring_rate_from_omega_sq(
+            angular_frequency_sq(target_frequency),
+            corner_weight_kg,
+            motion_ratio
+        )
     
     def calculate_damping(
         self,
@@ -594,23 +741,12 @@ class SetupEngineV2:
         Returns:
             Dict with DAMP_BUMP, DAMP_REBOUND, DAMP_FAST_BUMP, DAMP_FAST_REBOUND
         """
-        # Critical damping coefficient
-        # c_critical = 2 * sqrt(k * m)
-        c_critical = 2 * math.sqrt(spring_rate * corner_weight_kg)
-        
-        # Use 70% of critical damping as baseline (typical for race cars)
-        damping_coefficient = 0.7 * c_critical
-        
-        # Split into bump and rebound based on ratio
-        # If ratio is 2.5:1, then rebound = 2.5 * bump
-        # Total = bump + rebound = bump * (1 + ratio)
-        # So: bump = total / (1 + ratio)
-        bump = damping_coefficient / (1 + bump_rebound_ratio)
-        rebound = bump * bump_rebound_ratio
-        
-        # Fast damping is higher than slow
-        fast_bump = bump * fast_slow_ratio
-        fast_rebound = rebound * fast_slow_ratio
+        bump, rebound, fast_bump, fast_rebound = damping_coefficients(
+            spring_rate,
+            corner_weight_kg,
+            bump_rebound_ratio,
+            fast_slow_ratio
+        )
         
         # Convert to AC units (approximate scaling)
         # AC uses arbitrary units, scale to typical range
@@ -840,20 +976,17 @@ class SetupEngineV2:
         self,
         setup_values: Dict,
         rotation_factor: float  # 0.0 to 1.0
-    ) -> Dict:
+    ) -> None:
         """
         Apply rotation parameter chain.
         More rotation = Rear toe-out + Stiffer rear ARB + Higher diff coast
         
         Args:
-            setup_values: Current setup values
+            setup_values: Current setup values (modified in place)
             rotation_factor: 0=stable, 1=rotational
-        
-        Returns:
-            Modified setup values
         """
         if rotation_factor <= 0.5:
-            return setup_values  # No change for stable
+            return  # No change for stable
         
         # Calculate adjustment strength (0 to 0.5 → 0 to 1.0)
         strength = (rotation_factor - 0.5) * 2.0
@@ -875,27 +1008,22 @@ class SetupEngineV2:
         camber_mult = 1.0 - (strength * 0.15)  # Up to -15%
         setup_values["CAMBER_LR"] *= camber_mult
         setup_values["CAMBER_RR"] *= camber_mult
-        
-        return setup_values
     
     def apply_aggression_chain(
         self,
         setup_values: Dict,
         aggression_factor: float  # 0.0 to 1.0
-    ) -> Dict:
+    ) -> None:
         """
         Apply aggression parameter chain.
         More aggression = Stiffer springs + Lower ride height + More brake power
         
         Args:
-            setup_values: Current setup values
+            setup_values: Current setup values (modified in place)
             aggression_factor: 0=safe, 1=aggressive
-        
-        Returns:
-            Modified setup values
         """
         if aggression_factor <= 0.5:
-            return setup_values  # No change for safe
+            return  # No change for safe
         
         # Calculate adjustment strength
         strength = (aggression_factor - 0.5) * 2.0
@@ -927,8 +1055,6 @@ class SetupEngineV2:
         # 5. Increase diff power (more traction)
         power_add = strength * 10  # Up to +10%
         setup_values["DIFF_POWER"] = min(100, setup_values["DIFF_POWER"] + power_add)
-        
-        return setup_values
     
     # ═══════════════════════════════════════════════════════════════════════
     # 8. MAIN SETUP GENERATION
@@ -959,32 +1085,99 @@ class SetupEngineV2:
         """
         # 1. Classify car
         category = self.classify_car(car)
-        print(f"[SETUP V2] Car classified as: {category}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[SETUP V2] Car classified as: %s", category)
         
         # 2. Get physical targets
         targets = CATEGORY_TARGETS[category]
         
-        # 3. Initialize setup
-        setup = Setup(
-            name=f"{car.name} - {track.name} - {behavior_id}",
-            car_id=car.car_id,
-            track_id=track.full_id if track else "",
-            behavior=behavior_id
-        )
-        
-        # 4. Calculate tire pressures (dynamic)
+        # 3. Calculate tire pressures (dynamic)
         pressures = self.calculate_tire_pressures(category, ambient_temp, road_temp)
         
-        # 5. Calculate suspension (physics-based)
+        # 4-8. Suspension, ride heights, aero, differential, alignment
+        base_values = self._calculate_base_values(car, category)
+        
+        # 9-11. Assemble, apply behavior chains, organize into sections
+        setup = self._assemble_setup(car, track, behavior_id, profile, pressures, base_values)
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[SETUP V2] Generated setup for %s car", category)
+            log.debug("[SETUP V2] Cold pressures: F=%s, R=%s",
+                      pressures['PRESSURE_LF'], pressures['PRESSURE_LR'])
+            log.debug("[SETUP V2] Target hot: F=%s, R=%s",
+                      targets.hot_pressure_front, targets.hot_pressure_rear)
+        
+        return setup
+    
+    def generate_setups(
+        self,
+        car: Car,
+        track: Track,
+        behaviors: Sequence[str],
+        ambient_temps: Sequence[float],
+        road_temps: Sequence[float],
+        profile: Optional[DriverProfile] = None
+    ) -> List[Setup]:
+        """
+        Generate one setup per (behavior, ambient_temp, road_temp) row.
+        
+        Intended for sweeps over conditions: classification and all
+        car-dependent physics (springs, dampers, ride heights, aero,
+        differential, alignment) are computed once for the whole batch,
+        and tire pressures once per distinct temperature pair.
+        
+        Args:
+            car: Car object
+            track: Track object
+            behaviors: Behavior preset ID for each row
+            ambient_temps: Ambient temperature (°C) for each row
+            road_temps: Road temperature (°C) for each row
+            profile: Driver profile applied to every row
+        
+        Returns:
+            List of Setup objects, in row order
+        """
+        if not len(behaviors) == len(ambient_temps) == len(road_temps):
+            raise ValueError("behaviors, ambient_temps and road_temps must have the same length")
+        
+        category = self.classify_car(car)
+        base_values = self._calculate_base_values(car, category)
+        
+        pressures_cache: Dict[Tuple[float, float], Dict[str, float]] = {}
+        setups = []
+        
+        for behavior_id, ambient_temp, road_temp in zip(behaviors, ambient_temps, road_temps):
+            conditions = (ambient_temp, road_temp)
+            pressures = pressures_cache.get(conditions)
+            if pressures is None:
+                pressures = self.calculate_tire_pressures(category, ambient_temp, road_temp)
+                pressures_cache[conditions] = pressures
+            
+            setups.append(
+                self._assemble_setup(car, track, behavior_id, profile, pressures, base_values)
+            )
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[SETUP V2] Generated %d setups for %s car", len(setups), category)
+        
+        return setups
+    
+    def _calculate_base_values(self, car: Car, category: str) -> Dict[str, float]:
+        """
+        Calculate every setup value that does not depend on track conditions.
+        
+        Returns:
+            Dict of setup values (all keys except tire pressures)
+        """
+        targets = CATEGORY_TARGETS[category]
+        
+        # Calculate suspension (physics-based)
         # Estimate corner weights (assume 50/50 distribution for now)
         total_weight = car.weight_kg if car.weight_kg > 0 else 1200
         corner_weight = total_weight / 4
         
-        # Front suspension
-        spring_rate_front = self.calculate_spring_rate(
-            targets.front_frequency,
-            corner_weight
-        )
+        # Front suspension (ω² precomputed on the category targets)
+        spring_rate_front = spring_rate_from_omega_sq(targets.omega_front_sq, corner_weight)
         damping_front = self.calculate_damping(
             spring_rate_front,
             corner_weight,
@@ -993,10 +1186,7 @@ class SetupEngineV2:
         )
         
         # Rear suspension
-        spring_rate_rear = self.calculate_spring_rate(
-            targets.rear_frequency,
-            corner_weight
-        )
+        spring_rate_rear = spring_rate_from_omega_sq(targets.omega_rear_sq, corner_weight)
         damping_rear = self.calculate_damping(
             spring_rate_rear,
             corner_weight,
@@ -1004,48 +1194,26 @@ class SetupEngineV2:
             targets.fast_slow_ratio
         )
         
-        # 6. Calculate ride heights & aero
+        # Calculate ride heights & aero
         ride_heights = self.calculate_ride_heights(category, "circuit")
         aero = self.calculate_aero_settings(category, 150.0)
         
-        # 7. Calculate differential
+        # Calculate differential
         torque = (car.power_hp * 1.36) if car.power_hp > 0 else 400  # Rough estimate
         differential = self.calculate_differential(category, car.drivetrain, torque)
         
-        # 8. Calculate alignment
+        # Calculate alignment
         alignment = self.calculate_alignment(category, 2600.0)
         
-        # 9. Assemble setup values
-        setup_values = {
-            # Tires
-            **pressures,
+        return {
             "COMPOUND": 2,
             
             # Suspension
-            "SPRING_RATE_LF": int(spring_rate_front),
-            "SPRING_RATE_RF": int(spring_rate_front),
-            "SPRING_RATE_LR": int(spring_rate_rear),
-            "SPRING_RATE_RR": int(spring_rate_rear),
-            
-            "DAMP_BUMP_LF": damping_front["DAMP_BUMP"],
-            "DAMP_BUMP_RF": damping_front["DAMP_BUMP"],
-            "DAMP_BUMP_LR": damping_rear["DAMP_BUMP"],
-            "DAMP_BUMP_RR": damping_rear["DAMP_BUMP"],
-            
-            "DAMP_REBOUND_LF": damping_front["DAMP_REBOUND"],
-            "DAMP_REBOUND_RF": damping_front["DAMP_REBOUND"],
-            "DAMP_REBOUND_LR": damping_rear["DAMP_REBOUND"],
-            "DAMP_REBOUND_RR": damping_rear["DAMP_REBOUND"],
-            
-            "DAMP_FAST_BUMP_LF": damping_front["DAMP_FAST_BUMP"],
-            "DAMP_FAST_BUMP_RF": damping_front["DAMP_FAST_BUMP"],
-            "DAMP_FAST_BUMP_LR": damping_rear["DAMP_FAST_BUMP"],
-            "DAMP_FAST_BUMP_RR": damping_rear["DAMP_FAST_BUMP"],
-            
-            "DAMP_FAST_REBOUND_LF": damping_front["DAMP_FAST_REBOUND"],
-            "DAMP_FAST_REBOUND_RF": damping_front["DAMP_FAST_REBOUND"],
-            "DAMP_FAST_REBOUND_LR": damping_rear["DAMP_FAST_REBOUND"],
-            "DAMP_FAST_REBOUND_RR": damping_rear["DAMP_FAST_REBOUND"],
+            **_corner_dict("SPRING_RATE", int(spring_rate_front), int(spring_rate_rear)),
+            **_corner_dict("DAMP_BUMP", damping_front["DAMP_BUMP"], damping_rear["DAMP_BUMP"]),
+            **_corner_dict("DAMP_REBOUND", damping_front["DAMP_REBOUND"], damping_rear["DAMP_REBOUND"]),
+            **_corner_dict("DAMP_FAST_BUMP", damping_front["DAMP_FAST_BUMP"], damping_rear["DAMP_FAST_BUMP"]),
+            **_corner_dict("DAMP_FAST_REBOUND", damping_front["DAMP_FAST_REBOUND"], damping_rear["DAMP_FAST_REBOUND"]),
             
             **ride_heights,
             
@@ -1072,6 +1240,32 @@ class SetupEngineV2:
             # Fuel
             "FUEL": 30
         }
+    
+    def _assemble_setup(
+        self,
+        car: Car,
+        track: Track,
+        behavior_id: str,
+        profile: Optional[DriverProfile],
+        pressures: Dict[str, float],
+        base_values: Dict[str, float]
+    ) -> Setup:
+        """
+        Combine pressures and base values into a Setup, applying profile chains.
+        
+        Neither input dict is modified.
+        """
+        setup = Setup(
+            name=f"{car.name} - {track.name} - {behavior_id}",
+            car_id=car.car_id,
+            track_id=track.full_id if track else "",
+            behavior=behavior_id
+        )
+        
+        # 9. Assemble setup values
+        setup_values = _SETUP_VALUE_TEMPLATE.copy()
+        setup_values.update(pressures)
+        setup_values.update(base_values)
         
         # 10. Apply behavior parameter chains
         if profile:
@@ -1079,54 +1273,19 @@ class SetupEngineV2:
             
             # Rotation chain
             if "rotation" in factors:
-                setup_values = self.apply_rotation_chain(setup_values, factors["rotation"])
+                self.apply_rotation_chain(setup_values, factors["rotation"])
             
             # Aggression chain
             if "aggression" in factors:
-                setup_values = self.apply_aggression_chain(setup_values, factors["aggression"])
-        
-        # 11. Organize into sections
-        setup.sections["TYRES"] = SetupSection("TYRES", {
-            k: v for k, v in setup_values.items() 
-            if k.startswith("PRESSURE") or k == "COMPOUND"
-        })
-        
-        setup.sections["SUSPENSION"] = SetupSection("SUSPENSION", {
-            k: v for k, v in setup_values.items()
-            if k.startswith(("SPRING", "DAMP", "RIDE_HEIGHT", "PACKER"))
-        })
-        
-        setup.sections["ALIGNMENT"] = SetupSection("ALIGNMENT", {
-            k: v for k, v in setup_values.items()
-            if k.startswith(("CAMBER", "TOE", "CASTER"))
-        })
-        
-        setup.sections["DIFFERENTIAL"] = SetupSection("DIFFERENTIAL", {
-            k: v for k, v in setup_values.items()
-            if k.startswith("DIFF")
-        })
-        
-        setup.sections["ARB"] = SetupSection("ARB", {
-            "FRONT": setup_values["ARB_FRONT"],
-            "REAR": setup_values["ARB_REAR"]
-        })
-        
-        setup.sections["BRAKES"] = SetupSection("BRAKES", {
-            k: v for k, v in setup_values.items()
-            if k.startswith("BRAKE") or k.endswith("BIAS")
-        })
-        
-        setup.sections["AERO"] = SetupSection("AERO", {
-            k: v for k, v in setup_values.items()
-            if k.startswith(("WING", "SPLITTER")) or k == "REAR_WING"
-        })
-        
-        setup.sections["FUEL"] = SetupSection("FUEL", {
-            "FUEL": setup_values["FUEL"]
-        })
-        
-        print(f"[SETUP V2] Generated setup for {category} car")
-        print(f"[SETUP V2] Cold pressures: F={pressures['PRESSURE_LF']}, R={pressures['PRESSURE_LR']}")
-        print(f"[SETUP V2] Target hot: F={targets.hot_pressure_front}, R={targets.hot_pressure_rear}")
+                self.apply_aggression_chain(setup_values, factors["aggression"])
+        
+        # 11. Organize into sections (static key layout, no scanning)
+        for section, keys in SETUP_VALUE_LAYOUT.items():
+            if section == "ARB":
+                # ARB values are exported without their prefix
+                values = {"FRONT": setup_values["ARB_FRONT"], "REAR": setup_values["ARB_REAR"]}
+            else:
+                values = {key: setup_values[key] for key in keys}
+            setup.sections[section] = SetupSection(section, values)
         
         return setup
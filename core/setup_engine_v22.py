@@ -4,8 +4,12 @@ Integrates: Dynamic mapping, smart conversion, slider interdependencies, debug l
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, TYPE_CHECKING
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+import logging
+import re
 
 from models.setup import Setup, SetupSection
 from models.car import Car
@@ -13,21 +17,20 @@ from models.track import Track
 from models.driver_profile import DriverProfile
 
 from core.setup_engine_v2 import SetupEngineV2, CATEGORY_TARGETS
-from core.physics_refiner import PhysicsRefiner
-from core.dynamic_mapper import DynamicMapper, ValueTypeDetector
-from core.clicks_converter import SmartConverter, ClicksConverter
-from core.slider_interdependencies import SliderInterdependencyEngine
-from core.setup_debug_logger import SetupDebugLogger
-from core.setup_writer_v2 import SetupWriterV2
+
+if TYPE_CHECKING:
+    from core.setup_debug_logger import SetupDebugLogger
+
+log = logging.getLogger(__name__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # V2.2 CATEGORY TARGETS (Simplified dataclass for V2.2)
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryTargets:
-    """Simplified targets for V2.2 categories."""
+    """Simplified targets for V2.2 categories (immutable, shared between engines)."""
     frequency_front: float
     frequency_rear: float
     damping_ratio: float
@@ -46,7 +49,7 @@ class CategoryTargets:
     arb_bias: float
 
 
-CATEGORY_TARGETS_V22 = {
+CATEGORY_TARGETS_V22 = MappingProxyType({
     # GT3 / Race - Engineer validated
     "gt": CategoryTargets(
         frequency_front=2.8,
@@ -186,9 +189,46 @@ CATEGORY_TARGETS_V22 = {
         brake_bias=55.0,
         arb_bias=0.45
     ),
+})
+
+# Fallback targets for unknown categories
+_DEFAULT_TARGETS = CATEGORY_TARGETS_V22["street"]
+
+# Slider values used when a profile does not define them
+_PROFILE_DEFAULTS = {
+    "rotation": 0.5,
+    "slide": 0.5,
+    "aggression": 0.5,
+    "drift": 0.0,
+    "performance": 0.5,
+    "aero": 0.5,
 }
 
 
+# Track-type keyword patterns, checked in priority order
+_TRACK_TYPE_PATTERNS = (
+    # Touge / Mountain roads
+    ("touge", re.compile(
+        r"touge|akina|usui|irohazaka|haruna|myogi|sadamine|happogahara|tsuchisaka|shomaru"
+    )),
+    # Street circuits
+    ("street", re.compile(r"street|city|urban|highway|shutoko|wangan")),
+    # Drift tracks
+    ("drift", re.compile(r"drift|ebisu|meihan")),
+)
+
+
+@lru_cache(maxsize=256)
+def _detect_track_type_cached(track_name_lower: str) -> str:
+    """Detect track type from a lowercased track name (memoized)."""
+    for track_type, pattern in _TRACK_TYPE_PATTERNS:
+        if pattern.search(track_name_lower):
+            return track_type
+    
+    # Default to circuit
+    return "circuit"
+
+
 class SetupEngineV22:
     """
     Complete V2.2 Setup Engine with all features:
@@ -208,6 +248,14 @@ class SetupEngineV22:
         Args:
             setups_path: Path to AC setups folder
         """
+        # Heavy V2.2 components are imported here so that importing this
+        # module for classify_car/get_category_targets stays cheap
+        from core.physics_refiner import PhysicsRefiner
+        from core.dynamic_mapper import DynamicMapper, ValueTypeDetector
+        from core.clicks_converter import SmartConverter, ClicksConverter
+        from core.slider_interdependencies import SliderInterdependencyEngine
+        from core.setup_writer_v2 import SetupWriterV2
+        
         # Core engines
         self.v2_engine = SetupEngineV2()
         self.physics_refiner = PhysicsRefiner()
@@ -222,8 +270,8 @@ class SetupEngineV22:
         
         # State
         self.setups_path = setups_path
-        self.logger: Optional[SetupDebugLogger] = None
-        self.enable_debug_logging = True
+        self.logger: Optional["SetupDebugLogger"] = None
+        self.enable_debug_logging = False  # Opt-in: set True to collect a debug log
     
     def set_setups_path(self, path: Path):
         """Set the setups path for all components."""
@@ -263,11 +311,12 @@ class SetupEngineV22:
         Returns:
             Tuple of (Setup, metadata_dict)
         """
-        # Initialize logger
+        # Initialize logger (opt-in, one per generation)
         if self.enable_debug_logging:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.logger = SetupDebugLogger(Path(f"debug_v22_{timestamp}.log"))
+            from core.setup_debug_logger import SetupDebugLogger
+            self.logger = SetupDebugLogger(prefix="debug_v22")
+        else:
+            self.logger = None
         
         metadata = {
             "version": "2.2",
@@ -281,16 +330,19 @@ class SetupEngineV22:
         
         # Step 1: Classify car
         category = self.v2_engine.classify_car(car)
-        targets = CATEGORY_TARGETS_V22.get(category, CATEGORY_TARGETS_V22["street"])
+        targets = CATEGORY_TARGETS_V22.get(category, _DEFAULT_TARGETS)
         
         metadata["category"] = category
-        print(f"[V2.2] Car category: {category}")
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("[V2.2] Car category: %s", category)
         
         if self.logger:
             self.logger.set_metadata(car.car_id, track.full_id, behavior_id, category)
         
         # Step 2: Generate base setup with V2 physics
-        print(f"[V2.2] Generating physics-based setup...")
+        if debug:
+            log.debug("[V2.2] Generating physics-based setup...")
         base_setup = self.v2_engine.generate_setup(
             car=car,
             track=track,
@@ -301,7 +353,8 @@ class SetupEngineV22:
         )
         
         # Step 3: Apply physics refinement (motion ratio, anti-bottoming, fast damping cap)
-        print(f"[V2.2] Applying physics refinement...")
+        if debug:
+            log.debug("[V2.2] Applying physics refinement...")
         
         # Detect track type
         track_type = self._detect_track_type(track)
@@ -319,38 +372,38 @@ class SetupEngineV22:
             car_data=car_data
         )
         
+        # Detect if click-based (shared by the slider step and metadata)
+        is_click_based = self.value_detector.is_click_based(car.car_id, "spring")
+        
         # Step 4: Apply slider interdependencies (V2.2 "wow" effect)
         if profile:
-            print(f"[V2.2] Applying slider interdependencies...")
-            
-            # Detect if click-based
-            is_click_based = self.value_detector.is_click_based(car.car_id, "spring")
-            
             # Build profile dict
             profile_dict = {
-                "rotation": getattr(profile, "rotation", 0.5),
-                "slide": getattr(profile, "slide", 0.5),
-                "aggression": getattr(profile, "aggression", 0.5),
-                "drift": getattr(profile, "drift", 0.0),
-                "performance": getattr(profile, "performance", 0.5),
-                "aero": getattr(profile, "aero", 0.5) if hasattr(profile, "aero") else 0.5,
+                name: getattr(profile, name, default)
+                for name, default in _PROFILE_DEFAULTS.items()
             }
             
-            refined_setup, slider_changes = self.slider_engine.apply_all_sliders(
-                refined_setup, profile_dict, is_click_based
-            )
-            
-            metadata["changes"].extend(slider_changes)
-            
-            for change in slider_changes[:10]:  # Log first 10
-                print(f"  {change}")
+            # Neutral sliders change nothing, so skip the rule walk entirely
+            if not self.slider_engine.is_neutral_profile(profile_dict):
+                if debug:
+                    log.debug("[V2.2] Applying slider interdependencies...")
+                
+                refined_setup, slider_changes = self.slider_engine.apply_all_sliders(
+                    refined_setup, profile_dict, is_click_based
+                )
+                
+                metadata["changes"].extend(slider_changes)
+                
+                if debug:
+                    for change in slider_changes[:10]:  # Log first 10
+                        log.debug("  %s", change)
         
         # Step 5: Log final values
         if self.logger:
             self._log_final_values(refined_setup)
             self.logger.print_summary()
         
-        metadata["is_click_based"] = self.value_detector.is_click_based(car.car_id, "spring")
+        metadata["is_click_based"] = is_click_based
         
         return refined_setup, metadata
     
@@ -395,29 +448,7 @@ class SetupEngineV22:
     
     def _detect_track_type(self, track: Track) -> str:
         """Detect track type from track object."""
-        track_name_lower = track.name.lower()
-        
-        # Touge / Mountain roads
-        touge_keywords = ["touge", "akina", "usui", "irohazaka", "haruna", "myogi", 
-                         "sadamine", "happogahara", "tsuchisaka", "shomaru"]
-        for keyword in touge_keywords:
-            if keyword in track_name_lower:
-                return "touge"
-        
-        # Street circuits
-        street_keywords = ["street", "city", "urban", "highway", "shutoko", "wangan"]
-        for keyword in street_keywords:
-            if keyword in track_name_lower:
-                return "street"
-        
-        # Drift tracks
-        drift_keywords = ["drift", "ebisu", "meihan"]
-        for keyword in drift_keywords:
-            if keyword in track_name_lower:
-                return "drift"
-        
-        # Default to circuit
-        return "circuit"
+        return _detect_track_type_cached(track.name.lower())
     
     def _log_final_values(self, setup: Setup):
         """Log all final setup values."""
@@ -449,7 +480,7 @@ class SetupEngineV22:
     
     def get_category_targets(self, category: str) -> CategoryTargets:
         """Get targets for a category."""
-        return CATEGORY_TARGETS_V22.get(category, CATEGORY_TARGETS_V22["street"])
+        return CATEGORY_TARGETS_V22.get(category, _DEFAULT_TARGETS)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -4,14 +4,139 @@ Integrates all V2.2 systems for universal car support.
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import logging
+import os
+import re
 
 from models.setup import Setup, SetupSection
 from core.dynamic_mapper import DynamicMapper, ValueTypeDetector
 from core.clicks_converter import SmartConverter
 from core.setup_debug_logger import SetupDebugLogger
 
+log = logging.getLogger(__name__)
+
+
+# Single pass over an AC setup file: group 1 is a [SECTION] header,
+# group 2 the integer of a VALUE= line (anything else is skipped)
+_SETUP_ENTRY_RE = re.compile(
+    r"^[^\S\n]*(?:\[([^\n]*)\]|VALUE=[^\S\n]*([-+]?\d+)[^\S\n]*(?:=[^\n]*)?)[^\S\n]*$",
+    re.MULTILINE
+)
+
+
+# Internal parameter name -> (section, key) in our Setup
+_INTERNAL_TO_SETUP = {
+    # Pressures
+    "pressure_lf": ("TYRES", "PRESSURE_LF"),
+    "pressure_rf": ("TYRES", "PRESSURE_RF"),
+    "pressure_lr": ("TYRES", "PRESSURE_LR"),
+    "pressure_rr": ("TYRES", "PRESSURE_RR"),
+    
+    # Camber
+    "camber_lf": ("ALIGNMENT", "CAMBER_LF"),
+    "camber_rf": ("ALIGNMENT", "CAMBER_RF"),
+    "camber_lr": ("ALIGNMENT", "CAMBER_LR"),
+    "camber_rr": ("ALIGNMENT", "CAMBER_RR"),
+    
+    # Toe
+    "toe_lf": ("ALIGNMENT", "TOE_LF"),
+    "toe_rf": ("ALIGNMENT", "TOE_RF"),
+    "toe_lr": ("ALIGNMENT", "TOE_LR"),
+    "toe_rr": ("ALIGNMENT", "TOE_RR"),
+    
+    # Springs
+    "spring_lf": ("SUSPENSION", "SPRING_RATE_LF"),
+    "spring_rf": ("SUSPENSION", "SPRING_RATE_RF"),
+    "spring_lr": ("SUSPENSION", "SPRING_RATE_LR"),
+    "spring_rr": ("SUSPENSION", "SPRING_RATE_RR"),
+    
+    # Ride height
+    "ride_height_lf": ("SUSPENSION", "RIDE_HEIGHT_LF"),
+    "ride_height_rf": ("SUSPENSION", "RIDE_HEIGHT_RF"),
+    "ride_height_lr": ("SUSPENSION", "RIDE_HEIGHT_LR"),
+    "ride_height_rr": ("SUSPENSION", "RIDE_HEIGHT_RR"),
+    
+    # Dampers
+    "damp_bump_lf": ("SUSPENSION", "DAMP_BUMP_LF"),
+    "damp_bump_rf": ("SUSPENSION", "DAMP_BUMP_RF"),
+    "damp_bump_lr": ("SUSPENSION", "DAMP_BUMP_LR"),
+    "damp_bump_rr": ("SUSPENSION", "DAMP_BUMP_RR"),
+    "damp_rebound_lf": ("SUSPENSION", "DAMP_REBOUND_LF"),
+    "damp_rebound_rf": ("SUSPENSION", "DAMP_REBOUND_RF"),
+    "damp_rebound_lr": ("SUSPENSION", "DAMP_REBOUND_LR"),
+    "damp_rebound_rr": ("SUSPENSION", "DAMP_REBOUND_RR"),
+    "damp_fast_bump_lf": ("SUSPENSION", "DAMP_FAST_BUMP_LF"),
+    "damp_fast_bump_rf": ("SUSPENSION", "DAMP_FAST_BUMP_RF"),
+    "damp_fast_bump_lr": ("SUSPENSION", "DAMP_FAST_BUMP_LR"),
+    "damp_fast_bump_rr": ("SUSPENSION", "DAMP_FAST_BUMP_RR"),
+    "damp_fast_rebound_lf": ("SUSPENSION", "DAMP_FAST_REBOUND_LF"),
+    "damp_fast_rebound_rf": ("SUSPENSION", "DAMP_FAST_REBOUND_RF"),
+    "damp_fast_rebound_lr": ("SUSPENSION", "DAMP_FAST_REBOUND_LR"),
+    "damp_fast_rebound_rr": ("SUSPENSION", "DAMP_FAST_REBOUND_RR"),
+    
+    # ARB
+    "arb_front": ("ARB", "FRONT"),
+    "arb_rear": ("ARB", "REAR"),
+    
+    # Differential
+    "diff_power": ("DIFFERENTIAL", "POWER"),
+    "diff_coast": ("DIFFERENTIAL", "COAST"),
+    "diff_preload": ("DIFFERENTIAL", "PRELOAD"),
+    
+    # Brakes
+    "brake_bias": ("BRAKES", "FRONT_BIAS"),
+    "brake_power": ("BRAKES", "BRAKE_POWER_MULT"),
+    
+    # Aero
+    "wing_front": ("AERO", "WING_FRONT"),
+    "wing_rear": ("AERO", "WING_REAR"),
+    
+    # Fuel
+    "fuel": ("FUEL", "FUEL"),
+}
+
+# Alternative Setup keys tried when the primary key has no value
+_KEY_ALTERNATIVES = {
+    "FRONT_BIAS": ["BIAS", "BRAKE_BIAS"],
+    "BRAKE_POWER_MULT": ["BRAKE_POWER"],
+    "WING_FRONT": ["WING_0", "FWING"],
+    "WING_REAR": ["WING_1", "RWING", "WING"],
+}
+
+# Internal parameter name -> (section, keys to try), primary key first
+_INTERNAL_LOOKUP = {
+    internal_name: (section, (key, *_KEY_ALTERNATIVES.get(key, ())))
+    for internal_name, (section, key) in _INTERNAL_TO_SETUP.items()
+}
+
+# ASCII characters not allowed in generated filenames, mapped to "_"
+_FILENAME_TRANS = str.maketrans({
+    chr(i): "_" for i in range(128) if not (chr(i).isalnum() or chr(i) == "_")
+})
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a temporary sibling and swap it in, so path is never partial."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class SetupWriterV2:
     """
@@ -36,6 +161,23 @@ class SetupWriterV2:
         self.value_detector = ValueTypeDetector(base_path)
         self.smart_converter = SmartConverter()
         
+        # Parsed reference setups: car_id -> (file, (mtime_ns, size), params)
+        self._existing_cache: Dict[str, Tuple[Path, Tuple[int, int], Dict[str, int]]] = {}
+        
+        # INI emission order per parameter set (values change, keys rarely do)
+        self._sorted_keys_cache: Dict[frozenset, List[str]] = {}
+        
+        # Last full write per (car_id, track_id, filename):
+        # (params, {path: signature right after writing})
+        self._last_written: Dict[Tuple[str, str, str], Tuple[Dict[str, int], Dict[Path, Tuple[int, int]]]] = {}
+        
+        # Setup folders already created by this writer (skips repeat mkdir calls)
+        self._ensured_dirs: Set[Path] = set()
+        
+        # Background file writes (track copy overlaps the generic copy,
+        # debug logs are saved after the call returns)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="setup_io")
+        
         # Debug logger (created per write operation)
         self.logger: Optional[SetupDebugLogger] = None
         self.enable_debug_logging = True
@@ -43,6 +185,8 @@ class SetupWriterV2:
     def set_base_path(self, path: Path) -> None:
         """Set the base path for setup files."""
         self.base_path = path
+        self._ensured_dirs.clear()
+        self._last_written.clear()
         self.dynamic_mapper.set_setups_path(path)
         self.value_detector.set_setups_path(path)
     
@@ -64,7 +208,8 @@ class SetupWriterV2:
             track_id: Track identifier
             category: Car category (gt, formula, street, drift, etc.)
             filename: Optional custom filename
-            overwrite: Whether to overwrite existing files
+            overwrite: Whether to overwrite existing files (an identical
+                rewrite of our own last write is then skipped)
         
         Returns:
             Tuple of (success, message, file_path)
@@ -72,87 +217,158 @@ class SetupWriterV2:
         if not self.base_path:
             return False, "Base path not set", None
         
-        # Initialize debug logger
+        # One timestamp shared by the debug log and a generated filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Initialize debug logger (cleared when disabled so no stale logger keeps collecting)
         if self.enable_debug_logging:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_path = self.base_path / car_id / f"debug_{timestamp}.log"
             self.logger = SetupDebugLogger(log_path)
             self.logger.set_metadata(car_id, track_id, setup.behavior or "custom", category)
+        else:
+            self.logger = None
+        logger = self.logger
+        debug = log.isEnabledFor(logging.DEBUG)
         
         # Generate filename
         if not filename:
-            filename = self._generate_filename(setup)
+            filename = self._generate_filename(setup, timestamp)
         if not filename.endswith(".ini"):
             filename += ".ini"
         
         # Step 1: Get dynamic mapping for this car
-        print(f"[WRITER V2.2] Getting dynamic mapping for {car_id}...")
+        if debug:
+            log.debug("[WRITER V2.2] Getting dynamic mapping for %s...", car_id)
         car_mapping = self.dynamic_mapper.get_car_mapping(car_id)
         
-        if self.logger:
+        if logger:
             for internal, ac_name in car_mapping.items():
-                self.logger.log_exported(internal, ac_name, f"Mapped: {internal} → {ac_name}")
+                logger.log_exported(internal, ac_name, f"Mapped: {internal} → {ac_name}")
         
         # Step 2: Detect value types (clicks vs absolute)
-        print(f"[WRITER V2.2] Detecting value types...")
+        if debug:
+            log.debug("[WRITER V2.2] Detecting value types...")
         value_types = self.value_detector.detect_value_types(car_id)
         
         # Step 3: Read existing setup for reference values
         existing_params = self._read_existing_setup(car_id)
         
         # Step 4: Convert our setup values to AC format
-        print(f"[WRITER V2.2] Converting values...")
+        if debug:
+            log.debug("[WRITER V2.2] Converting values...")
         final_params = self._convert_setup_to_ac(
             setup, car_id, category, car_mapping, existing_params
         )
         
-        # Step 5: Build INI content
+        generic_dir = self.base_path / car_id / "generic"
+        setup_dir = self.base_path / car_id / track_id
+        file_path = setup_dir / filename
+        
+        # Same values as our last write of this file to these paths, and both
+        # copies untouched since: nothing to rebuild or write. Only when
+        # overwriting; otherwise the generic copy is rewritten as before.
+        write_key = (car_id, track_id, filename)
+        last_written = self._last_written.get(write_key)
+        if (
+            overwrite
+            and last_written
+            and last_written[0] == final_params
+            and last_written[1].keys() == {generic_dir / filename, file_path}
+            and all(
+                _file_signature(path) == signature
+                for path, signature in last_written[1].items()
+            )
+        ):
+            if debug:
+                log.debug("[WRITER V2.2] Unchanged, skipped write: %s", file_path)
+            if logger:
+                self._io_pool.submit(logger.snapshot().save, "text")
+            return True, f"Setup unchanged: {file_path}", file_path
+        
+        # Step 5: Build INI content (encoded once, shared by both destinations;
+        # newlines translated like a text-mode write)
         ini_content = self._build_ini_content(final_params, car_id)
+        ini_bytes = ini_content.replace("\n", os.linesep).encode("utf-8")
+        
+        same_file = file_path == generic_dir / filename
+        
+        # Step 7a: Prepare track-specific folder; the track copy is written on
+        # the I/O thread while the generic copy is written here
+        track_dir_error = None
+        try:
+            self._ensure_dir(setup_dir)
+        except (PermissionError, OSError) as e:
+            track_dir_error = e
+        
+        track_blocked = not overwrite and (same_file or file_path.exists())
+        track_future = None
+        if track_dir_error is None and not track_blocked and not same_file:
+            track_future = self._io_pool.submit(self._write_file, file_path, ini_bytes)
         
         # Step 6: Save to generic folder
-        generic_dir = self.base_path / car_id / "generic"
         generic_path = None
         try:
-            generic_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(generic_dir)
             generic_path = generic_dir / filename
-            with open(generic_path, "w", encoding="utf-8") as f:
-                f.write(ini_content)
+            self._write_file(generic_path, ini_bytes)
             print(f"[WRITER V2.2] Saved to generic: {generic_path}")
         except (PermissionError, OSError) as e:
             print(f"[WRITER V2.2] Warning: Could not save to generic: {e}")
         
-        # Step 7: Save to track-specific folder
-        setup_dir = self.base_path / car_id / track_id
-        try:
-            setup_dir.mkdir(parents=True, exist_ok=True)
-        except (PermissionError, OSError) as e:
+        # Step 7b: Collect the track write
+        track_error = None
+        if track_future is not None:
+            try:
+                track_future.result()
+            except (PermissionError, OSError) as e:
+                track_error = e
+        elif same_file and generic_path is None:
+            track_error = OSError(f"Could not write {file_path}")
+        
+        if track_dir_error is not None:
             if generic_path:
                 return True, f"Setup saved to generic only: {generic_path}", generic_path
-            return False, f"Cannot create directory: {e}", None
-        
-        file_path = setup_dir / filename
+            return False, f"Cannot create directory: {track_dir_error}", None
         
-        if file_path.exists() and not overwrite:
+        if track_blocked:
             if generic_path:
                 return True, f"Setup saved to generic: {generic_path}", generic_path
             return False, "File exists and overwrite=False", None
         
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(ini_content)
-            print(f"[WRITER V2.2] Saved to track: {file_path}")
-        except (PermissionError, OSError) as e:
+        if track_error is not None:
             if generic_path:
                 return True, f"Setup saved to generic only: {generic_path}", generic_path
-            return False, f"Cannot write file: {e}", None
+            return False, f"Cannot write file: {track_error}", None
         
-        # Step 8: Save debug log
-        if self.logger and self.enable_debug_logging:
-            self.logger.save(format="text")
-            print(f"[WRITER V2.2] Debug log saved")
+        print(f"[WRITER V2.2] Saved to track: {file_path}")
+        
+        if generic_path:
+            self._last_written[write_key] = (
+                final_params,
+                {path: _file_signature(path) for path in (generic_path, file_path)}
+            )
+        
+        # Step 8: Save debug log (formatted and written on the I/O thread)
+        if logger:
+            self._io_pool.submit(logger.snapshot().save, "text")
         
         return True, f"Setup saved: {file_path}", file_path
     
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a setup folder once per writer (and base path)."""
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
+    
+    def _write_file(self, path: Path, data: bytes) -> None:
+        """Atomically write a setup file, recreating its folder if it was removed."""
+        try:
+            _atomic_write(path, data)
+        except FileNotFoundError:
+            self._ensured_dirs.discard(path.parent)
+            self._ensure_dir(path.parent)
+            _atomic_write(path, data)
+    
     def _convert_setup_to_ac(
         self,
         setup: Setup,
@@ -176,150 +392,65 @@ class SetupWriterV2:
         # If no existing params found, we'll use a minimal common set
         final_params = dict(existing_params)  # Start with existing as base
         
-        print(f"[WRITER V2.2] Existing params for {car_id}: {list(existing_params.keys())}")
-        
-        # Internal name to section/key mapping
-        internal_to_setup = {
-            # Pressures
-            "pressure_lf": ("TYRES", "PRESSURE_LF"),
-            "pressure_rf": ("TYRES", "PRESSURE_RF"),
-            "pressure_lr": ("TYRES", "PRESSURE_LR"),
-            "pressure_rr": ("TYRES", "PRESSURE_RR"),
-            
-            # Camber
-            "camber_lf": ("ALIGNMENT", "CAMBER_LF"),
-            "camber_rf": ("ALIGNMENT", "CAMBER_RF"),
-            "camber_lr": ("ALIGNMENT", "CAMBER_LR"),
-            "camber_rr": ("ALIGNMENT", "CAMBER_RR"),
-            
-            # Toe
-            "toe_lf": ("ALIGNMENT", "TOE_LF"),
-            "toe_rf": ("ALIGNMENT", "TOE_RF"),
-            "toe_lr": ("ALIGNMENT", "TOE_LR"),
-            "toe_rr": ("ALIGNMENT", "TOE_RR"),
-            
-            # Springs
-            "spring_lf": ("SUSPENSION", "SPRING_RATE_LF"),
-            "spring_rf": ("SUSPENSION", "SPRING_RATE_RF"),
-            "spring_lr": ("SUSPENSION", "SPRING_RATE_LR"),
-            "spring_rr": ("SUSPENSION", "SPRING_RATE_RR"),
-            
-            # Ride height
-            "ride_height_lf": ("SUSPENSION", "RIDE_HEIGHT_LF"),
-            "ride_height_rf": ("SUSPENSION", "RIDE_HEIGHT_RF"),
-            "ride_height_lr": ("SUSPENSION", "RIDE_HEIGHT_LR"),
-            "ride_height_rr": ("SUSPENSION", "RIDE_HEIGHT_RR"),
-            
-            # Dampers
-            "damp_bump_lf": ("SUSPENSION", "DAMP_BUMP_LF"),
-            "damp_bump_rf": ("SUSPENSION", "DAMP_BUMP_RF"),
-            "damp_bump_lr": ("SUSPENSION", "DAMP_BUMP_LR"),
-            "damp_bump_rr": ("SUSPENSION", "DAMP_BUMP_RR"),
-            "damp_rebound_lf": ("SUSPENSION", "DAMP_REBOUND_LF"),
-            "damp_rebound_rf": ("SUSPENSION", "DAMP_REBOUND_RF"),
-            "damp_rebound_lr": ("SUSPENSION", "DAMP_REBOUND_LR"),
-            "damp_rebound_rr": ("SUSPENSION", "DAMP_REBOUND_RR"),
-            "damp_fast_bump_lf": ("SUSPENSION", "DAMP_FAST_BUMP_LF"),
-            "damp_fast_bump_rf": ("SUSPENSION", "DAMP_FAST_BUMP_RF"),
-            "damp_fast_bump_lr": ("SUSPENSION", "DAMP_FAST_BUMP_LR"),
-            "damp_fast_bump_rr": ("SUSPENSION", "DAMP_FAST_BUMP_RR"),
-            "damp_fast_rebound_lf": ("SUSPENSION", "DAMP_FAST_REBOUND_LF"),
-            "damp_fast_rebound_rf": ("SUSPENSION", "DAMP_FAST_REBOUND_RF"),
-            "damp_fast_rebound_lr": ("SUSPENSION", "DAMP_FAST_REBOUND_LR"),
-            "damp_fast_rebound_rr": ("SUSPENSION", "DAMP_FAST_REBOUND_RR"),
-            
-            # ARB
-            "arb_front": ("ARB", "FRONT"),
-            "arb_rear": ("ARB", "REAR"),
-            
-            # Differential
-            "diff_power": ("DIFFERENTIAL", "POWER"),
-            "diff_coast": ("DIFFERENTIAL", "COAST"),
-            "diff_preload": ("DIFFERENTIAL", "PRELOAD"),
-            
-            # Brakes
-            "brake_bias": ("BRAKES", "FRONT_BIAS"),
-            "brake_power": ("BRAKES", "BRAKE_POWER_MULT"),
-            
-            # Aero
-            "wing_front": ("AERO", "WING_FRONT"),
-            "wing_rear": ("AERO", "WING_REAR"),
+        logger = self.logger
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("[WRITER V2.2] Existing params for %s: %s", car_id, list(existing_params))
+        
+        # Process each parameter we know - ONLY if it exists in the car's setup!
+        # (Same relative order as the mapper, so shared AC names resolve identically)
+        items: List[Tuple[str, float, Optional[int]]] = []  # (ac_name, value, existing)
+        sources: List[str] = []  # "SECTION/KEY" each value came from
+        sections = setup.sections
+        for internal_name, (section, keys) in _INTERNAL_LOOKUP.items():
+            ac_name = car_mapping.get(internal_name)
+            if ac_name is None:
+                continue
             
-            # Fuel
-            "fuel": ("FUEL", "FUEL"),
-        }
-        
-        # Process each parameter - ONLY if it exists in the car's setup!
-        for internal_name, ac_name in car_mapping.items():
             # CRITICAL: Only modify parameters that exist for this car
             if existing_params and ac_name not in existing_params:
-                print(f"[WRITER V2.2] Skipping {ac_name} - not available for this car")
-                if self.logger:
-                    self.logger.log_ignored(ac_name, f"Parameter not available for {car_id}")
-                continue
-            
-            # Get our internal value
-            if internal_name not in internal_to_setup:
+                if debug:
+                    log.debug("[WRITER V2.2] Skipping %s - not available for this car", ac_name)
+                if logger:
+                    logger.log_ignored(ac_name, f"Parameter not available for {car_id}")
                 continue
             
-            section, key = internal_to_setup[internal_name]
-            our_value = setup.get_value(section, key, None)
-            
-            # Also try alternative keys
-            if our_value is None:
-                our_value = self._get_value_alternatives(setup, section, key)
+            # Get our internal value (primary key, then its alternatives)
+            our_value = None
+            setup_section = sections.get(section)
+            if setup_section is not None:
+                for candidate in keys:
+                    our_value = setup_section.values.get(candidate)
+                    if our_value is not None:
+                        break
             
             if our_value is None:
-                if self.logger:
-                    self.logger.log_ignored(ac_name, f"No value in setup for {section}/{key}")
+                if logger:
+                    logger.log_ignored(ac_name, f"No value in setup for {section}/{keys[0]}")
                 continue
             
-            # Log calculation
-            if self.logger:
-                self.logger.log_calculation(ac_name, our_value, "internal", f"From setup {section}/{key}")
-            
-            # Get existing value for type detection
-            existing_value = existing_params.get(ac_name)
-            
-            # Convert using smart converter
-            converted, conversion_log = self.smart_converter.detect_and_convert(
-                car_id=car_id,
-                category=category,
-                param_name=ac_name,
-                physical_value=our_value,
-                existing_value=existing_value
-            )
-            
-            # Log conversion
-            if self.logger:
-                self.logger.log_conversion(ac_name, our_value, converted, conversion_log)
+            # Queue for conversion (existing value drives type detection)
+            items.append((ac_name, our_value, existing_params.get(ac_name)))
+            sources.append(f"{section}/{keys[0]}")
+        
+        # Convert every queued parameter in one smart converter call
+        results = self.smart_converter.detect_and_convert_many(car_id, category, items)
+        
+        for (ac_name, our_value, _), source, (converted, conversion_log) in zip(items, sources, results):
+            # Log calculation and conversion
+            if logger:
+                logger.log_calculation(ac_name, our_value, "internal", f"From setup {source}")
+                logger.log_conversion(ac_name, our_value, converted, conversion_log)
             
             # Store final value
             final_params[ac_name] = converted
             
             # Log export
-            if self.logger:
-                self.logger.log_exported(ac_name, converted, f"[{ac_name}]\nVALUE={converted}")
+            if logger:
+                logger.log_exported(ac_name, converted, f"[{ac_name}]\nVALUE={converted}")
         
         return final_params
     
-    def _get_value_alternatives(self, setup: Setup, section: str, key: str) -> Optional[float]:
-        """Try alternative key names."""
-        alternatives = {
-            "FRONT_BIAS": ["BIAS", "BRAKE_BIAS"],
-            "BRAKE_POWER_MULT": ["BRAKE_POWER"],
-            "WING_FRONT": ["WING_0", "FWING"],
-            "WING_REAR": ["WING_1", "RWING", "WING"],
-        }
-        
-        if key in alternatives:
-            for alt in alternatives[key]:
-                val = setup.get_value(section, alt, None)
-                if val is not None:
-                    return val
-        
-        return None
-    
     def _read_existing_setup(self, car_id: str) -> Dict[str, int]:
         """Read existing setup to get reference values."""
         params = {}
@@ -339,81 +470,93 @@ class SetupWriterV2:
         if generic_last.exists():
             setup_file = generic_last
         else:
-            # Any last.ini
-            for track_dir in car_dir.iterdir():
-                if track_dir.is_dir():
-                    last_ini = track_dir / "last.ini"
-                    if last_ini.exists():
-                        setup_file = last_ini
-                        break
+            # Any track's last.ini
+            setup_file = next(car_dir.glob("*/last.ini"), None)
         
         if not setup_file:
             # Any .ini file
-            for ini in car_dir.rglob("*.ini"):
-                setup_file = ini
-                break
+            setup_file = next(car_dir.rglob("*.ini"), None)
         
         if not setup_file:
             return params
         
-        # Parse it
+        # Reuse the parsed values while the file is unchanged
+        signature = _file_signature(setup_file)
+        if signature is None:
+            return params
+        
+        cached = self._existing_cache.get(car_id)
+        if cached and cached[0] == setup_file and cached[1] == signature:
+            return dict(cached[2])
+        
+        params = self._parse_setup_file(setup_file)
+        self._existing_cache[car_id] = (setup_file, signature, params)
+        
+        return dict(params)
+    
+    def _parse_setup_file(self, setup_file: Path) -> Dict[str, int]:
+        """Parse VALUE entries of an AC setup file into {section: value}."""
+        params = {}
+        
+        # Read once; UTF-16 setups are decoded from the same buffer
+        raw = setup_file.read_bytes()
         try:
-            content = setup_file.read_text(encoding="utf-8")
+            content = raw.decode("utf-8")
         except UnicodeDecodeError:
             try:
-                content = setup_file.read_text(encoding="utf-16")
-            except:
+                content = raw.decode("utf-16")
+            except UnicodeDecodeError:
                 return params
         
         current_section = None
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("[") and line.endswith("]"):
-                current_section = line[1:-1]
-            elif line.startswith("VALUE=") and current_section:
-                try:
-                    value = int(line.split("=")[1])
-                    params[current_section] = value
-                except:
-                    pass
+        for match in _SETUP_ENTRY_RE.finditer(content):
+            section, value = match.groups()
+            if section is not None:
+                current_section = section
+            elif current_section:
+                params[current_section] = int(value)
         
         return params
     
     def _build_ini_content(self, params: Dict[str, int], car_id: str) -> str:
         """Build INI file content from parameters."""
-        lines = []
+        # Sorted parameter names, reused while the parameter set is unchanged
+        key_set = frozenset(param for param in params if not param.startswith("_"))
+        sorted_keys = self._sorted_keys_cache.get(key_set)
+        if sorted_keys is None:
+            sorted_keys = self._sorted_keys_cache[key_set] = sorted(key_set)
         
-        # Sort parameters alphabetically
-        for param in sorted(params.keys()):
-            if param.startswith("_"):
-                continue
-            value = params[param]
-            lines.append(f"[{param}]")
-            lines.append(f"VALUE={value}")
-            lines.append("")
-        
-        # Add car model
-        lines.append("[CAR]")
-        lines.append(f"MODEL={car_id}")
-        lines.append("")
-        
-        # Add CSP version
-        lines.append("[__EXT_PATCH]")
-        lines.append("VERSION=0.2.5-preview1")
-        lines.append("")
-        
-        return "\n".join(lines)
+        # One "[PARAM]\nVALUE=x\n\n" block per parameter, sorted alphabetically
+        parts = [f"[{param}]\nVALUE={params[param]}\n\n" for param in sorted_keys]
+        
+        # Car model and CSP version
+        parts.append(f"[CAR]\nMODEL={car_id}\n\n[__EXT_PATCH]\nVERSION=0.2.5-preview1\n")
+        
+        return "".join(parts)
     
-    def _generate_filename(self, setup: Setup) -> str:
-        """Generate filename for setup."""
+    def _generate_filename(self, setup: Setup, timestamp: Optional[str] = None) -> str:
+        """Generate filename for setup (timestamp: YYYYmmdd_HHMMSS, default now)."""
         if setup.name:
-            name_clean = "".join(c if c.isalnum() or c in "_ -" else "_" for c in setup.name)
-            return name_clean.replace(" ", "_").replace("-", "_")
+            # Everything except letters, digits and "_" becomes "_"
+            name_clean = setup.name.translate(_FILENAME_TRANS)
+            if not name_clean.isascii():
+                name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in name_clean)
+            return name_clean
         
         behavior = setup.behavior or "custom"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"rea_v22_{behavior}_{timestamp}"
     
+    def close(self) -> None:
+        """
+        Wait for pending background writes and stop the I/O thread.
+        
+        Queued debug log saves are flushed here too; call it before exit
+        rather than leaving them to interpreter shutdown.
+        """
+        self._io_pool.shutdown(wait=True)
+    
     def get_mapping_summary(self, car_id: str) -> str:
         """Get mapping summary for a car."""
         return self.dynamic_mapper.get_mapping_summary(car_id)
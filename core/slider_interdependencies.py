@@ -3,16 +3,20 @@ Slider Interdependencies V2.2 - Multi-parameter effects for each slider.
 Each slider modifies multiple related parameters for a "wow" effect.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
-from models.setup import Setup
+from functools import lru_cache
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    from models.setup import Setup
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # INTERDEPENDENCY DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SliderEffect:
     """Definition of a slider's effect on a parameter."""
     param_section: str      # Setup section (SUSPENSION, ALIGNMENT, etc.)
@@ -22,8 +26,8 @@ class SliderEffect:
     description: str        # Human-readable description
 
 
-# Slider definitions with interdependencies
-SLIDER_INTERDEPENDENCIES = {
+# Slider definitions with interdependencies (read-only)
+SLIDER_INTERDEPENDENCIES = MappingProxyType({
     # ═══════════════════════════════════════════════════════════════════════
     # AERO SLIDER (0.0 = low downforce, 1.0 = high downforce)
     # ═══════════════════════════════════════════════════════════════════════
@@ -273,9 +277,210 @@ SLIDER_INTERDEPENDENCIES = {
                         "Rear pressure: -0.5 PSI at max"),
         ]
     },
+})
+
+
+# Integer codes for SliderEffect.effect_type, dispatched on in apply_slider
+_ADD = 0
+_MULTIPLY = 1
+_SET = 2
+
+_EFFECT_TYPE_CODES = {"add": _ADD, "multiply": _MULTIPLY, "set": _SET}
+
+
+# Alternative key names tried when a setup lacks the primary key
+_KEY_ALTERNATIVES = {
+    "WING_REAR": ("WING_1", "REAR_WING", "RWING", "WING"),
+    "WING_FRONT": ("WING_0", "FRONT_WING", "FWING"),
+    "FRONT_BIAS": ("BRAKE_BIAS", "BIAS"),
+    "BRAKE_POWER_MULT": ("BRAKE_POWER",),
+}
+
+
+# (offset, scale) normalizing each slider value to its effect range:
+# centered sliders map 0.0..1.0 to -1.0..+1.0, 0-based sliders keep 0.0..1.0.
+# The offset is also the slider's neutral value; adding a slider is one entry.
+_SLIDER_NORMALIZATION = {
+    "rotation": (0.5, 2.0),
+    "slide": (0.5, 2.0),
+    "aggression": (0.0, 1.0),
+    "drift": (0.0, 1.0),
+    "performance": (0.0, 1.0),
+    "aero": (0.0, 1.0),
+}
+
+
+def _build_slider_table(effects: list, offset: float, scale: float) -> Dict[str, Any]:
+    """Split a slider's effects into parallel per-field tuples."""
+    return {
+        "offset": offset,
+        "scale": scale,
+        "sections": tuple(effect.param_section for effect in effects),
+        "keys": tuple(effect.param_key for effect in effects),
+        # Primary key first, then its alternatives in lookup order
+        "candidates": tuple(
+            (effect.param_key,) + _KEY_ALTERNATIVES.get(effect.param_key, ())
+            for effect in effects
+        ),
+        "type_codes": tuple(_EFFECT_TYPE_CODES.get(effect.effect_type, -1) for effect in effects),
+        "bases": tuple(effect.base_effect for effect in effects),
+        "descriptions": tuple(effect.description for effect in effects),
+        # Springs and dampers get smaller adjustments on click-based cars
+        "click_scaled": tuple(
+            effect.param_section == "SUSPENSION"
+            and ("SPRING" in effect.param_key or "DAMP" in effect.param_key)
+            for effect in effects
+        ),
+    }
+
+
+# Precomputed effect tables, built once at import
+_SLIDER_TABLES = {
+    slider_name: _build_slider_table(slider_def["effects"], *_SLIDER_NORMALIZATION[slider_name])
+    for slider_name, slider_def in SLIDER_INTERDEPENDENCIES.items()
 }
 
 
+# UI sliders move in 0.01 steps (101 values); size the caches so a full sweep
+# of every slider, for both click-based and absolute cars, stays resident
+_SLIDER_STEPS = 101
+_SLIDER_CACHE_SIZE = len(_SLIDER_TABLES) * _SLIDER_STEPS * 2
+
+
+@lru_cache(maxsize=_SLIDER_CACHE_SIZE)
+def _slider_magnitudes(slider_name: str, slider_value: float) -> Tuple[float, ...]:
+    """
+    Effect magnitudes of a slider at a given value.
+    
+    Pure function of the static tables, so UI sweeps over the same
+    slider steps are served from the cache.
+    """
+    table = _SLIDER_TABLES[slider_name]
+    
+    # Centered sliders (rotation: 0.0 = understeer, 0.5 = neutral, 1.0 = oversteer)
+    # normalize to -1.0..+1.0; 0-based sliders use the raw value
+    normalized = (slider_value - table["offset"]) * table["scale"]
+    
+    return tuple(normalized * base for base in table["bases"])
+
+
+@lru_cache(maxsize=_SLIDER_CACHE_SIZE)
+def _slider_operands(slider_name: str, slider_value: float, is_click_based: bool) -> Tuple[float, ...]:
+    """
+    Per-effect operands of a slider at a given value.
+    
+    Each operand is what the effect applies to the current value: the
+    addend for "add", the multiplier for "multiply" and the new value for
+    "set", with click-based scaling already folded in.
+    """
+    table = _SLIDER_TABLES[slider_name]
+    operands = []
+    
+    for type_code, click_scaled, magnitude in zip(
+        table["type_codes"], table["click_scaled"],
+        _slider_magnitudes(slider_name, slider_value)
+    ):
+        # For click-based, springs and dampers use smaller adjustments
+        click_scaled = is_click_based and click_scaled
+        
+        if type_code == _ADD:
+            operands.append(magnitude * 0.1 if click_scaled else magnitude)  # 10% of normal
+        elif type_code == _MULTIPLY:
+            operands.append(1.0 + (magnitude * 0.5 if click_scaled else magnitude))  # 50% of normal multiplier
+        else:
+            operands.append(magnitude)
+    
+    return tuple(operands)
+
+
+@lru_cache(maxsize=256)
+def _profile_plan(slider_items: Tuple[Tuple[str, float], ...], is_click_based: bool) -> tuple:
+    """
+    Compose a whole profile into one value * scale + offset step per parameter.
+    
+    Adds are summed into the offset and multipliers scale both terms, so the
+    result matches applying the sliders one after another.
+    
+    Returns:
+        Tuple of (section, keys, steps) with one (candidates, scale, offset)
+        step per key, grouped by section
+    """
+    # section -> key -> [candidate keys, scale, offset]
+    composed = {}
+    
+    for slider_name, slider_value in slider_items:
+        if _is_neutral(slider_name, slider_value):
+            continue
+        
+        table = _SLIDER_TABLES[slider_name]
+        operands = _slider_operands(slider_name, slider_value, is_click_based)
+        
+        for section, key, candidates, type_code, operand in zip(
+            table["sections"], table["keys"], table["candidates"],
+            table["type_codes"], operands
+        ):
+            steps = composed.get(section)
+            if steps is None:
+                steps = composed[section] = {}
+            step = steps.get(key)
+            if step is None:
+                step = steps[key] = [candidates, 1.0, 0.0]
+            
+            if type_code == _ADD:
+                step[2] += operand
+            elif type_code == _MULTIPLY:
+                step[1] *= operand
+                step[2] *= operand
+            elif type_code == _SET:
+                step[1] = 0.0
+                step[2] = operand
+    
+    return tuple(
+        (section, tuple(steps), tuple(tuple(step) for step in steps.values()))
+        for section, steps in composed.items()
+    )
+
+
+def _format_slider_description(slider_name: str, slider_def: dict) -> str:
+    """Build the human-readable description of what a slider does."""
+    lines = [
+        f"=== {slider_name.upper()} SLIDER ===",
+        slider_def["description"],
+        "",
+        "Effects:"
+    ]
+    
+    for effect in slider_def["effects"]:
+        lines.append(f"  • {effect.description}")
+    
+    return "\n".join(lines)
+
+
+# Slider descriptions are static, so they are formatted once at import
+_SLIDER_DESCRIPTIONS = {
+    slider_name: _format_slider_description(slider_name, slider_def)
+    for slider_name, slider_def in SLIDER_INTERDEPENDENCIES.items()
+}
+_ALL_DESCRIPTIONS = "\n".join(
+    f"{description}\n" for description in _SLIDER_DESCRIPTIONS.values()
+)
+
+
+# Slider value at which a slider has no effect.
+# Centered sliders are neutral at 0.5, 0-based sliders at 0.0.
+NEUTRAL_SLIDER_VALUES = {
+    slider_name: offset for slider_name, (offset, _) in _SLIDER_NORMALIZATION.items()
+}
+
+# Slider values this close to neutral are treated as neutral
+_NEUTRAL_TOLERANCE = 1e-6
+
+
+def _is_neutral(slider_name: str, slider_value: float) -> bool:
+    """Check whether a slider value leaves the setup untouched."""
+    return abs(slider_value - NEUTRAL_SLIDER_VALUES[slider_name]) < _NEUTRAL_TOLERANCE
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # SLIDER INTERDEPENDENCY ENGINE
 # ═══════════════════════════════════════════════════════════════════════════
@@ -289,14 +494,16 @@ class SliderInterdependencyEngine:
     
     def __init__(self):
         self.interdependencies = SLIDER_INTERDEPENDENCIES
+        self._tables = _SLIDER_TABLES
     
     def apply_slider(
         self,
-        setup: Setup,
+        setup: "Setup",
         slider_name: str,
         slider_value: float,
-        is_click_based: bool = False
-    ) -> tuple[Setup, list[str]]:
+        is_click_based: bool = False,
+        record_changes: bool = True
+    ) -> tuple["Setup", list[str]]:
         """
         Apply a slider's interdependent effects to a setup.
         
@@ -305,6 +512,7 @@ class SliderInterdependencyEngine:
             slider_name: Name of slider (aero, rotation, slide, aggression, drift, performance)
             slider_value: Slider value (0.0 to 1.0)
             is_click_based: Whether this car uses click-based values
+            record_changes: Whether to build the human-readable change list
         
         Returns:
             Tuple of (modified_setup, list_of_changes)
@@ -312,86 +520,116 @@ class SliderInterdependencyEngine:
         if slider_name not in self.interdependencies:
             return setup, [f"Unknown slider: {slider_name}"]
         
-        slider_def = self.interdependencies[slider_name]
         changes = []
         
-        # Normalize slider value to -1.0 to +1.0 range (centered at 0.5)
-        # For sliders like rotation: 0.0 = understeer, 0.5 = neutral, 1.0 = oversteer
-        normalized = (slider_value - 0.5) * 2  # -1.0 to +1.0
+        # A neutral slider changes nothing; skip the effect walk entirely
+        if not _is_neutral(slider_name, slider_value):
+            self._apply_effects(
+                setup, slider_name, slider_value, is_click_based,
+                changes if record_changes else None
+            )
         
-        # For sliders that are 0-based (aero, aggression, drift, performance)
-        # Use raw value (0.0 to 1.0)
-        if slider_name in ["aero", "aggression", "drift", "performance"]:
-            normalized = slider_value
+        return setup, changes
+    
+    def _apply_effects(
+        self,
+        setup: "Setup",
+        slider_name: str,
+        slider_value: float,
+        is_click_based: bool,
+        changes: Optional[list]
+    ) -> None:
+        """
+        Apply a known slider's effects to a setup in place.
         
-        for effect in slider_def["effects"]:
-            # Calculate effect magnitude
-            magnitude = normalized * effect.base_effect
-            
-            # Get current value
-            current = setup.get_value(effect.param_section, effect.param_key, None)
-            
-            if current is None:
-                # Try alternative key names
-                current = self._get_value_with_alternatives(setup, effect.param_section, effect.param_key)
+        Change messages are appended to changes, or skipped when it is None,
+        so apply_all_sliders can collect every slider into one list.
+        """
+        table = self._tables[slider_name]
+        record_changes = changes is not None
+        
+        # Magnitudes (for the change log) and operands only depend on the
+        # slider, so both are cached
+        magnitudes = _slider_magnitudes(slider_name, slider_value)
+        operands = _slider_operands(slider_name, slider_value, is_click_based)
+        get_section = setup.get_section
+        
+        for section, key, candidates, type_code, magnitude, operand, description in zip(
+            table["sections"], table["keys"], table["candidates"],
+            table["type_codes"], magnitudes, operands, table["descriptions"]
+        ):
+            # Get current value, trying alternative key names against
+            # the section's values directly (one section lookup per effect).
+            # None marks a miss, matching Setup.get_value's default.
+            current = None
+            setup_section = get_section(section)
+            if setup_section is not None:
+                values = setup_section.values
+                for candidate in candidates:
+                    current = values.get(candidate)
+                    if current is not None:
+                        break
             
             if current is None:
-                changes.append(f"[SKIP] {effect.param_key}: Not found in setup")
+                if record_changes:
+                    changes.append(f"[SKIP] {key}: Not found in setup")
                 continue
             
-            # Apply effect
-            if effect.effect_type == "add":
-                new_value = current + magnitude
-                change_str = f"{effect.param_key}: {current:.2f} + {magnitude:+.2f} = {new_value:.2f}"
-            elif effect.effect_type == "multiply":
-                multiplier = 1.0 + magnitude
-                new_value = current * multiplier
-                change_str = f"{effect.param_key}: {current:.2f} × {multiplier:.2f} = {new_value:.2f}"
-            elif effect.effect_type == "set":
-                new_value = magnitude
-                change_str = f"{effect.param_key}: {current:.2f} → {new_value:.2f}"
+            # Apply effect (the change log shows the unscaled effect)
+            if type_code == _ADD:
+                new_value = current + operand
+                if record_changes:
+                    change_str = f"{key}: {current:.2f} + {magnitude:+.2f} = {current + magnitude:.2f}"
+            elif type_code == _MULTIPLY:
+                new_value = current * operand
+                if record_changes:
+                    multiplier = 1.0 + magnitude
+                    change_str = f"{key}: {current:.2f} × {multiplier:.2f} = {current * multiplier:.2f}"
+            elif type_code == _SET:
+                new_value = operand
+                if record_changes:
+                    change_str = f"{key}: {current:.2f} → {new_value:.2f}"
             else:
                 continue
             
-            # Scale adjustments for click-based setups
-            if is_click_based and effect.param_section == "SUSPENSION":
-                if "SPRING" in effect.param_key or "DAMP" in effect.param_key:
-                    # For click-based, use smaller adjustments
-                    if effect.effect_type == "add":
-                        new_value = current + (magnitude * 0.1)  # 10% of normal
-                    elif effect.effect_type == "multiply":
-                        new_value = current * (1.0 + magnitude * 0.5)  # 50% of normal multiplier
+            # An identity effect (e.g. scaling a zero value) is a no-op write;
+            # skip it unless the value still has to move to the primary key
+            if new_value == current and candidate == key:
+                continue
             
             # Set the new value
-            setup.set_value(effect.param_section, effect.param_key, new_value)
-            changes.append(f"[{slider_name.upper()}] {change_str} ({effect.description})")
-        
-        return setup, changes
+            setup.set_value(section, key, new_value)
+            if record_changes:
+                changes.append(f"[{slider_name.upper()}] {change_str} ({description})")
     
-    def _get_value_with_alternatives(self, setup: Setup, section: str, key: str) -> Optional[float]:
-        """Try to get value using alternative key names."""
-        # Map of alternative names
-        alternatives = {
-            "WING_REAR": ["WING_1", "REAR_WING", "RWING", "WING"],
-            "WING_FRONT": ["WING_0", "FRONT_WING", "FWING"],
-            "FRONT_BIAS": ["BRAKE_BIAS", "BIAS"],
-            "BRAKE_POWER_MULT": ["BRAKE_POWER"],
-        }
+    def apply_slider_silent(
+        self,
+        setup: "Setup",
+        slider_name: str,
+        slider_value: float,
+        is_click_based: bool = False
+    ) -> "Setup":
+        """
+        Apply a slider's effects without building the change list.
         
-        if key in alternatives:
-            for alt in alternatives[key]:
-                val = setup.get_value(section, alt, None)
-                if val is not None:
-                    return val
+        Intended for hot loops (e.g. sweeps over profile space) that only
+        need the modified setup.
         
-        return None
+        Returns:
+            The modified setup
+        """
+        setup, _ = self.apply_slider(
+            setup, slider_name, slider_value, is_click_based, record_changes=False
+        )
+        return setup
     
     def apply_all_sliders(
         self,
-        setup: Setup,
+        setup: "Setup",
         profile: dict,
-        is_click_based: bool = False
-    ) -> tuple[Setup, list[str]]:
+        is_click_based: bool = False,
+        record_changes: bool = True
+    ) -> tuple["Setup", list[str]]:
         """
         Apply all sliders from a profile to a setup.
         
@@ -399,14 +637,93 @@ class SliderInterdependencyEngine:
             setup: Setup to modify
             profile: Dict with slider values (rotation, slide, aggression, drift, performance, aero)
             is_click_based: Whether this car uses click-based values
+            record_changes: Whether to build the human-readable change list
         
         Returns:
             Tuple of (modified_setup, list_of_all_changes)
         """
         all_changes = []
+        changes = all_changes if record_changes else None
+        
+        # Apply each slider, appending straight into the shared change list
+        for slider_name, slider_value in self._slider_values(profile).items():
+            # Skip neutral values (0.5 for centered sliders, 0.0 for 0-based)
+            if _is_neutral(slider_name, slider_value):
+                continue
+            
+            self._apply_effects(setup, slider_name, slider_value, is_click_based, changes)
+        
+        return setup, all_changes
+    
+    def apply_profile_fused(
+        self,
+        setup: "Setup",
+        profile: dict,
+        is_click_based: bool = False
+    ) -> "Setup":
+        """
+        Apply all sliders from a profile in a single pass over the setup.
+        
+        Equivalent to apply_all_sliders(..., record_changes=False), but the
+        effects of every slider on a parameter are first composed into one
+        value * scale + offset step, so each parameter is read and written
+        once instead of once per slider touching it.
+        
+        Args:
+            setup: Setup to modify
+            profile: Dict with slider values (rotation, slide, aggression, drift, performance, aero)
+            is_click_based: Whether this car uses click-based values
+        
+        Returns:
+            The modified setup
+        """
+        # The composed plan only depends on the slider values, so it is cached
+        plan = _profile_plan(tuple(self._slider_values(profile).items()), is_click_based)
+        
+        # One batched read and one batched write per touched section
+        for section, keys, steps in plan:
+            if section not in setup.sections:
+                continue
+            
+            updates = {}
+            for current, (candidates, scale, offset) in zip(
+                setup.get_values(section, keys), steps
+            ):
+                if current is not None:
+                    # Identity steps on the primary key are no-op writes
+                    new_value = current * scale + offset
+                    if new_value != current:
+                        updates[candidates[0]] = new_value
+                    continue
+                
+                # Fall back to alternative key names on a miss
+                for current in setup.get_values(section, candidates[1:]):
+                    if current is not None:
+                        updates[candidates[0]] = current * scale + offset
+                        break
+            
+            setup.set_values(section, updates)
+        
+        return setup
+    
+    def is_neutral_profile(self, profile: dict) -> bool:
+        """
+        Check whether a profile leaves every slider at its neutral value.
         
-        # Apply each slider
-        slider_mapping = {
+        Args:
+            profile: Dict with slider values (rotation, slide, aggression, drift, performance, aero)
+        
+        Returns:
+            True if apply_all_sliders would make no changes for this profile
+        """
+        return all(
+            _is_neutral(slider_name, slider_value)
+            for slider_name, slider_value in self._slider_values(profile).items()
+        )
+    
+    def _slider_values(self, profile: dict) -> dict:
+        """Resolve slider values from a profile, filling in missing sliders."""
+        return {
             "rotation": profile.get("rotation", 0.5),
             "slide": profile.get("slide", 0.5),
             "aggression": profile.get("aggression", 0.5),
@@ -414,43 +731,14 @@ class SliderInterdependencyEngine:
             "performance": profile.get("performance", 0.5),
             "aero": profile.get("aero", 0.5),
         }
-        
-        for slider_name, slider_value in slider_mapping.items():
-            # Skip neutral values (0.5 for centered sliders, 0.0 for 0-based)
-            if slider_name in ["aero", "aggression", "drift", "performance"]:
-                if slider_value == 0.0:
-                    continue
-            else:
-                if slider_value == 0.5:
-                    continue
-            
-            setup, changes = self.apply_slider(setup, slider_name, slider_value, is_click_based)
-            all_changes.extend(changes)
-        
-        return setup, all_changes
     
     def get_slider_description(self, slider_name: str) -> str:
         """Get description of what a slider does."""
         if slider_name not in self.interdependencies:
             return f"Unknown slider: {slider_name}"
         
-        slider_def = self.interdependencies[slider_name]
-        lines = [
-            f"=== {slider_name.upper()} SLIDER ===",
-            slider_def["description"],
-            "",
-            "Effects:"
-        ]
-        
-        for effect in slider_def["effects"]:
-            lines.append(f"  • {effect.description}")
-        
-        return "\n".join(lines)
+        return _SLIDER_DESCRIPTIONS[slider_name]
     
     def get_all_descriptions(self) -> str:
         """Get descriptions of all sliders."""
-        lines = []
-        for slider_name in self.interdependencies:
-            lines.append(self.get_slider_description(slider_name))
-            lines.append("")
-        return "\n".join(lines)
+        return _ALL_DESCRIPTIONS
@@ -3,10 +3,16 @@ Setup Repository - SQLite database for storing setups and profiles.
 Handles persistence of setups, driver profiles, and feedback.
 """
 
+import copy
+import os
+import queue
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 from datetime import datetime
 
 from models.setup import Setup
@@ -14,10 +20,218 @@ from models.driver_profile import DriverProfile
 from ai.feedback_engine import FeedbackEntry
 
 
+# Bound encode/decode of preconfigured codecs: skips json.dumps/loads
+# argument handling per call, and compact separators shrink stored JSON.
+# Values are plain dicts/lists of scalars, so the circular check is moot.
+_encode_json = json.JSONEncoder(check_circular=False, separators=(",", ":")).encode
+_decode_json = json.JSONDecoder().decode
+
+
+# ═══════════════════════════════════════════════════════════════
+# SQL STATEMENTS
+# ═══════════════════════════════════════════════════════════════
+# One canonical string per query, so sqlite3's statement cache reuses
+# the prepared statement on every call instead of re-parsing the SQL.
+
+# Prepared statements kept per connection; comfortably above the number
+# of distinct statements below, so none is ever evicted and re-prepared
+_STATEMENT_CACHE_SIZE = 128
+
+# Column lists read by the _row_to_* converters, which unpack rows by
+# position; keep each list in sync with its converter
+_PROFILE_COLUMNS = (
+    "profile_id, name, stability_rotation, grip_slide, safety_aggression, "
+    "drift_grip, comfort_performance, preferred_behavior, experience_level, "
+    "created_at, last_used"
+)
+_SETUP_COLUMNS = (
+    "setup_id, name, car_id, track_id, behavior, sections_json, "
+    "created_at, notes, ai_score, ai_confidence"
+)
+_FEEDBACK_COLUMNS = (
+    "feedback_id, setup_id, profile_id, feedback_type, rating, "
+    "issues_json, comments, behavior, created_at"
+)
+
+# Schema (run as one script; IF NOT EXISTS keeps it idempotent)
+_SQL_SCHEMA = """
+    BEGIN;
+    -- Driver profiles table
+    CREATE TABLE IF NOT EXISTS driver_profiles (
+        profile_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        stability_rotation REAL DEFAULT 50.0,
+        grip_slide REAL DEFAULT 30.0,
+        safety_aggression REAL DEFAULT 40.0,
+        drift_grip REAL DEFAULT 70.0,
+        comfort_performance REAL DEFAULT 50.0,
+        preferred_behavior TEXT DEFAULT 'balanced',
+        experience_level TEXT DEFAULT 'intermediate',
+        created_at TEXT,
+        last_used TEXT,
+        is_active INTEGER DEFAULT 0
+    );
+
+    -- Setups table
+    CREATE TABLE IF NOT EXISTS setups (
+        setup_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        car_id TEXT NOT NULL,
+        track_id TEXT NOT NULL,
+        behavior TEXT,
+        sections_json TEXT,
+        created_at TEXT,
+        notes TEXT,
+        ai_score REAL DEFAULT 0.0,
+        ai_confidence REAL DEFAULT 0.0,
+        profile_id INTEGER,
+        file_path TEXT,
+        FOREIGN KEY (profile_id) REFERENCES driver_profiles(profile_id)
+    );
+
+    -- Feedback table
+    CREATE TABLE IF NOT EXISTS feedback (
+        feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        setup_id INTEGER,
+        profile_id INTEGER,
+        feedback_type TEXT DEFAULT 'rating',
+        rating INTEGER DEFAULT 3,
+        issues_json TEXT,
+        comments TEXT,
+        behavior TEXT,
+        created_at TEXT,
+        FOREIGN KEY (setup_id) REFERENCES setups(setup_id),
+        FOREIGN KEY (profile_id) REFERENCES driver_profiles(profile_id)
+    );
+
+    -- Settings table
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+
+    -- Indexes for the list queries, so they range-scan instead of sorting
+    CREATE INDEX IF NOT EXISTS idx_setups_car_track_created
+    ON setups(car_id, track_id, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_setups_created
+    ON setups(created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_feedback_profile_created
+    ON feedback(profile_id, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_profiles_active
+    ON driver_profiles(is_active) WHERE is_active = 1;
+    COMMIT;
+"""
+
+# Driver profiles
+_SQL_INSERT_DEFAULT_PROFILE = """
+    INSERT INTO driver_profiles
+    (name, stability_rotation, grip_slide, safety_aggression,
+     drift_grip, comfort_performance, preferred_behavior,
+     experience_level, created_at, last_used, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_PROFILE = """
+    UPDATE driver_profiles SET
+        name = ?,
+        stability_rotation = ?,
+        grip_slide = ?,
+        safety_aggression = ?,
+        drift_grip = ?,
+        comfort_performance = ?,
+        preferred_behavior = ?,
+        experience_level = ?,
+        last_used = ?
+    WHERE profile_id = ?
+"""
+_SQL_INSERT_PROFILE = """
+    INSERT INTO driver_profiles
+    (name, stability_rotation, grip_slide, safety_aggression,
+     drift_grip, comfort_performance, preferred_behavior,
+     experience_level, created_at, last_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_HAS_PROFILES = "SELECT EXISTS (SELECT 1 FROM driver_profiles)"
+_SQL_GET_PROFILE = f"SELECT {_PROFILE_COLUMNS} FROM driver_profiles WHERE profile_id = ?"
+_SQL_GET_ACTIVE_PROFILE = f"SELECT {_PROFILE_COLUMNS} FROM driver_profiles WHERE is_active = 1 LIMIT 1"
+_SQL_GET_FIRST_PROFILE = f"SELECT {_PROFILE_COLUMNS} FROM driver_profiles LIMIT 1"
+_SQL_DEACTIVATE_PROFILES = "UPDATE driver_profiles SET is_active = 0"
+_SQL_ACTIVATE_PROFILE = "UPDATE driver_profiles SET is_active = 1 WHERE profile_id = ?"
+_SQL_GET_ALL_PROFILES = f"SELECT {_PROFILE_COLUMNS} FROM driver_profiles ORDER BY last_used DESC"
+_SQL_DELETE_PROFILE = "DELETE FROM driver_profiles WHERE profile_id = ?"
+
+# Setups
+_SQL_UPDATE_SETUP = """
+    UPDATE setups SET
+        name = ?,
+        car_id = ?,
+        track_id = ?,
+        behavior = ?,
+        sections_json = ?,
+        notes = ?,
+        ai_score = ?,
+        ai_confidence = ?,
+        profile_id = ?,
+        file_path = ?
+    WHERE setup_id = ?
+"""
+_SQL_INSERT_SETUP = """
+    INSERT INTO setups
+    (name, car_id, track_id, behavior, sections_json,
+     created_at, notes, ai_score, ai_confidence, profile_id, file_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_SETUP = f"SELECT {_SETUP_COLUMNS} FROM setups WHERE setup_id = ?"
+_SQL_GET_SETUP_VALUE = "SELECT json_extract(sections_json, ?) FROM setups WHERE setup_id = ?"
+_SQL_GET_SETUPS_FOR_CAR_TRACK = f"SELECT {_SETUP_COLUMNS} FROM setups WHERE car_id = ? AND track_id = ? ORDER BY created_at DESC"
+_SQL_GET_RECENT_SETUPS = f"SELECT {_SETUP_COLUMNS} FROM setups ORDER BY created_at DESC LIMIT ?"
+_SQL_GET_SETUP_SUMMARIES = """
+    SELECT setup_id, name, car_id, track_id, behavior, created_at, ai_score
+    FROM setups ORDER BY created_at DESC LIMIT ?
+"""
+_SQL_DELETE_SETUP = "DELETE FROM setups WHERE setup_id = ?"
+
+# Feedback
+_SQL_INSERT_FEEDBACK = """
+    INSERT INTO feedback
+    (setup_id, profile_id, feedback_type, rating, issues_json,
+     comments, behavior, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_FEEDBACK_FOR_PROFILE = f"SELECT {_FEEDBACK_COLUMNS} FROM feedback WHERE profile_id = ? ORDER BY created_at DESC"
+
+# Settings
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+_SQL_DELETE_SETTING = "DELETE FROM settings WHERE key = ?"
+
+
+@dataclass(frozen=True, slots=True)
+class SetupSummary:
+    """Lightweight setup listing entry, without the setup values."""
+    
+    setup_id: int
+    name: str
+    car_id: str
+    track_id: str
+    behavior: Optional[str]
+    created_at: Optional[datetime]
+    ai_score: float
+
+
 class SetupRepository:
     """
     SQLite repository for storing application data.
     Manages setups, driver profiles, and feedback entries.
+    
+    Writes go through a single writer connection; reads borrow one of up
+    to os.cpu_count() read-only connections, so under WAL a slow save never
+    blocks a UI read. In-memory databases cannot be shared between
+    connections and read through the writer instead.
+    
+    Write transactions start with BEGIN IMMEDIATE (the writer's isolation
+    level), so a writer takes the write lock up front instead of failing
+    with SQLITE_BUSY when upgrading a read lock. Methods issuing several
+    writes group them in one transaction and commit once.
     """
     
     def __init__(self, db_path: Path):
@@ -28,113 +242,132 @@ class SetupRepository:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
-        self._connection: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._reader_count = 0
+        self._reader_limit = os.cpu_count() or 1
+        self._reader_lock = threading.Lock()
+        
+        # get_active_profile() memo; any profile write bumps the generation
+        # so a lookup racing with the write cannot store a stale result
+        self._active_profile_cache: Optional[DriverProfile] = None
+        self._active_profile_cache_valid = False
+        self._profile_generation = 0
+        self._active_profile_lock = threading.Lock()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
+    def _get_writer(self) -> sqlite3.Connection:
+        """Get or create the writer connection."""
+        if self._writer is None:
             # Ensure directory exists
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self._connection = sqlite3.connect(
+            self._writer = sqlite3.connect(
                 str(self.db_path),
-                check_same_thread=False
+                check_same_thread=False,
+                isolation_level="IMMEDIATE",
+                cached_statements=_STATEMENT_CACHE_SIZE
             )
-            self._connection.row_factory = sqlite3.Row
+            self._writer.row_factory = sqlite3.Row
+            
+            # WAL lets reads proceed during a write and syncs once per
+            # checkpoint instead of on every commit
+            if not self._is_memory():
+                try:
+                    self._writer.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError:
+                    # Read-only or unsupported filesystem: keep the rollback journal
+                    pass
+            
+            self._apply_pragmas(self._writer)
         
-        return self._connection
+        return self._writer
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool."""
+        writer = self._get_writer()
+        if self._is_memory():
+            yield writer
+            return
+        
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a new reader, or wait for a free one once the pool is full."""
+        with self._reader_lock:
+            if self._reader_count >= self._reader_limit:
+                full = True
+            else:
+                full = False
+                self._reader_count += 1
+        
+        if full:
+            return self._readers.get()
+        
+        conn = sqlite3.connect(
+            self.db_path.resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+    
+    def _is_memory(self) -> bool:
+        """Check whether the database lives in memory only."""
+        return str(self.db_path) == ":memory:"
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Tune a new connection for an interactive single-user app."""
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-20000;
+            PRAGMA temp_store=MEMORY;
+        """)
     
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close all database connections."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._reader_count = 0
     
     def initialize_database(self) -> None:
         """Create database tables if they don't exist."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        # Driver profiles table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS driver_profiles (
-                profile_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                stability_rotation REAL DEFAULT 50.0,
-                grip_slide REAL DEFAULT 30.0,
-                safety_aggression REAL DEFAULT 40.0,
-                drift_grip REAL DEFAULT 70.0,
-                comfort_performance REAL DEFAULT 50.0,
-                preferred_behavior TEXT DEFAULT 'balanced',
-                experience_level TEXT DEFAULT 'intermediate',
-                created_at TEXT,
-                last_used TEXT,
-                is_active INTEGER DEFAULT 0
-            )
-        """)
-        
-        # Setups table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS setups (
-                setup_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                car_id TEXT NOT NULL,
-                track_id TEXT NOT NULL,
-                behavior TEXT,
-                sections_json TEXT,
-                created_at TEXT,
-                notes TEXT,
-                ai_score REAL DEFAULT 0.0,
-                ai_confidence REAL DEFAULT 0.0,
-                profile_id INTEGER,
-                file_path TEXT,
-                FOREIGN KEY (profile_id) REFERENCES driver_profiles(profile_id)
-            )
-        """)
-        
-        # Feedback table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS feedback (
-                feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                setup_id INTEGER,
-                profile_id INTEGER,
-                feedback_type TEXT DEFAULT 'rating',
-                rating INTEGER DEFAULT 3,
-                issues_json TEXT,
-                comments TEXT,
-                behavior TEXT,
-                created_at TEXT,
-                FOREIGN KEY (setup_id) REFERENCES setups(setup_id),
-                FOREIGN KEY (profile_id) REFERENCES driver_profiles(profile_id)
-            )
-        """)
-        
-        # Settings table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        """)
-        
-        conn.commit()
+        # All DDL in one script and one transaction
+        conn.executescript(_SQL_SCHEMA)
         
         # Create default profile if none exists
-        cursor.execute("SELECT COUNT(*) FROM driver_profiles")
-        if cursor.fetchone()[0] == 0:
+        cursor.execute(_SQL_HAS_PROFILES)
+        if not cursor.fetchone()[0]:
             self._create_default_profile(cursor)
             conn.commit()
+            self._invalidate_active_profile()
     
     def _create_default_profile(self, cursor: sqlite3.Cursor) -> None:
         """Create a default driver profile."""
         now = datetime.now().isoformat()
-        cursor.execute("""
-            INSERT INTO driver_profiles 
-            (name, stability_rotation, grip_slide, safety_aggression, 
-             drift_grip, comfort_performance, preferred_behavior, 
-             experience_level, created_at, last_used, is_active)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_SQL_INSERT_DEFAULT_PROFILE, (
             "Default Driver",
             50.0, 30.0, 40.0, 70.0, 50.0,
             "balanced", "intermediate",
@@ -150,26 +383,14 @@ class SetupRepository:
         Save a driver profile.
         Returns the profile ID.
         """
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
         now = datetime.now().isoformat()
         
         if profile.profile_id:
             # Update existing
-            cursor.execute("""
-                UPDATE driver_profiles SET
-                    name = ?,
-                    stability_rotation = ?,
-                    grip_slide = ?,
-                    safety_aggression = ?,
-                    drift_grip = ?,
-                    comfort_performance = ?,
-                    preferred_behavior = ?,
-                    experience_level = ?,
-                    last_used = ?
-                WHERE profile_id = ?
-            """, (
+            cursor.execute(_SQL_UPDATE_PROFILE, (
                 profile.name,
                 profile.stability_rotation,
                 profile.grip_slide,
@@ -184,13 +405,7 @@ class SetupRepository:
             profile_id = profile.profile_id
         else:
             # Insert new
-            cursor.execute("""
-                INSERT INTO driver_profiles 
-                (name, stability_rotation, grip_slide, safety_aggression,
-                 drift_grip, comfort_performance, preferred_behavior,
-                 experience_level, created_at, last_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_PROFILE, (
                 profile.name,
                 profile.stability_rotation,
                 profile.grip_slide,
@@ -204,97 +419,116 @@ class SetupRepository:
             profile_id = cursor.lastrowid
         
         conn.commit()
+        self._invalidate_active_profile()
         return profile_id
     
     def get_profile(self, profile_id: int) -> Optional[DriverProfile]:
         """Get a driver profile by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT * FROM driver_profiles WHERE profile_id = ?",
-            (profile_id,)
-        )
-        row = cursor.fetchone()
-        
-        if not row:
-            return None
-        
-        return self._row_to_profile(row)
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_PROFILE, (profile_id,))
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            return self._row_to_profile(row)
     
     def get_active_profile(self) -> Optional[DriverProfile]:
-        """Get the currently active driver profile."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """
+        Get the currently active driver profile.
         
-        cursor.execute(
-            "SELECT * FROM driver_profiles WHERE is_active = 1 LIMIT 1"
-        )
-        row = cursor.fetchone()
+        The result is memoized until the next profile write through this
+        repository. Callers get their own copy, so mutating it does not
+        affect the memo.
+        """
+        with self._active_profile_lock:
+            if self._active_profile_cache_valid:
+                return copy.copy(self._active_profile_cache)
+            generation = self._profile_generation
         
-        if not row:
-            # Return first profile if no active
-            cursor.execute("SELECT * FROM driver_profiles LIMIT 1")
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_ACTIVE_PROFILE)
             row = cursor.fetchone()
+            
+            if not row:
+                # Return first profile if no active
+                cursor.execute(_SQL_GET_FIRST_PROFILE)
+                row = cursor.fetchone()
+            
+            profile = self._row_to_profile(row) if row else None
         
-        if not row:
-            return None
+        with self._active_profile_lock:
+            if generation == self._profile_generation:
+                self._active_profile_cache = profile
+                self._active_profile_cache_valid = True
         
-        return self._row_to_profile(row)
+        return copy.copy(profile)
+    
+    def _invalidate_active_profile(self) -> None:
+        """Drop the memoized active profile after a profile write."""
+        with self._active_profile_lock:
+            self._profile_generation += 1
+            self._active_profile_cache = None
+            self._active_profile_cache_valid = False
     
     def set_active_profile(self, profile_id: int) -> None:
         """Set a profile as the active profile."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        # Deactivate all
-        cursor.execute("UPDATE driver_profiles SET is_active = 0")
-        
-        # Activate selected
-        cursor.execute(
-            "UPDATE driver_profiles SET is_active = 1 WHERE profile_id = ?",
-            (profile_id,)
-        )
+        # Both updates in one transaction, so no reader sees zero active profiles
+        with conn:
+            # Deactivate all
+            cursor.execute(_SQL_DEACTIVATE_PROFILES)
+            
+            # Activate selected
+            cursor.execute(_SQL_ACTIVATE_PROFILE, (profile_id,))
         
-        conn.commit()
+        self._invalidate_active_profile()
     
     def get_all_profiles(self) -> list[DriverProfile]:
         """Get all driver profiles."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM driver_profiles ORDER BY last_used DESC")
-        rows = cursor.fetchall()
-        
-        return [self._row_to_profile(row) for row in rows]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_ALL_PROFILES)
+            rows = cursor.fetchall()
+            
+            return [self._row_to_profile(row) for row in rows]
     
     def delete_profile(self, profile_id: int) -> bool:
         """Delete a driver profile."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        cursor.execute(
-            "DELETE FROM driver_profiles WHERE profile_id = ?",
-            (profile_id,)
-        )
+        cursor.execute(_SQL_DELETE_PROFILE, (profile_id,))
         conn.commit()
+        self._invalidate_active_profile()
         
         return cursor.rowcount > 0
     
     def _row_to_profile(self, row: sqlite3.Row) -> DriverProfile:
-        """Convert a database row to a DriverProfile."""
+        """Convert a database row (_PROFILE_COLUMNS order) to a DriverProfile."""
+        (profile_id, name, stability_rotation, grip_slide, safety_aggression,
+         drift_grip, comfort_performance, preferred_behavior, experience_level,
+         created_at, last_used) = row
+        
         return DriverProfile(
-            profile_id=row["profile_id"],
-            name=row["name"],
-            stability_rotation=row["stability_rotation"],
-            grip_slide=row["grip_slide"],
-            safety_aggression=row["safety_aggression"],
-            drift_grip=row["drift_grip"],
-            comfort_performance=row["comfort_performance"],
-            preferred_behavior=row["preferred_behavior"],
-            experience_level=row["experience_level"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
-            last_used=datetime.fromisoformat(row["last_used"]) if row["last_used"] else datetime.now()
+            profile_id=profile_id,
+            name=name,
+            stability_rotation=stability_rotation,
+            grip_slide=grip_slide,
+            safety_aggression=safety_aggression,
+            drift_grip=drift_grip,
+            comfort_performance=comfort_performance,
+            preferred_behavior=preferred_behavior,
+            experience_level=experience_level,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            last_used=datetime.fromisoformat(last_used) if last_used else datetime.now()
         )
     
     # ═══════════════════════════════════════════════════════════════
@@ -306,31 +540,57 @@ class SetupRepository:
         Save a setup to the database.
         Returns the setup ID.
         """
-        conn = self._get_connection()
+        conn = self._get_writer()
+        cursor = conn.cursor()
+        
+        setup_id = self._write_setup(cursor, setup, profile_id, file_path)
+        
+        conn.commit()
+        return setup_id
+    
+    def save_setups_bulk(
+        self,
+        setups: list[Setup],
+        profile_id: Optional[int] = None,
+        file_paths: Optional[list[Optional[str]]] = None
+    ) -> list[int]:
+        """
+        Save several setups in a single transaction.
+        Returns the setup IDs in input order.
+        
+        Rows store each setup's own created_at, so the batch makes no
+        per-row clock reads.
+        """
+        conn = self._get_writer()
         cursor = conn.cursor()
         
+        if file_paths is None:
+            file_paths = [None] * len(setups)
+        
+        # One commit for the whole batch (rolled back on error)
+        with conn:
+            return [
+                self._write_setup(cursor, setup, profile_id, file_path)
+                for setup, file_path in zip(setups, file_paths)
+            ]
+    
+    def _write_setup(
+        self,
+        cursor: sqlite3.Cursor,
+        setup: Setup,
+        profile_id: Optional[int],
+        file_path: Optional[str]
+    ) -> int:
+        """Insert or update a setup row without committing. Returns the setup ID."""
         # Serialize sections to JSON
         sections_dict = {}
         for name, section in setup.sections.items():
             sections_dict[name] = section.values
-        sections_json = json.dumps(sections_dict)
+        sections_json = _encode_json(sections_dict)
         
         if setup.setup_id:
             # Update existing
-            cursor.execute("""
-                UPDATE setups SET
-                    name = ?,
-                    car_id = ?,
-                    track_id = ?,
-                    behavior = ?,
-                    sections_json = ?,
-                    notes = ?,
-                    ai_score = ?,
-                    ai_confidence = ?,
-                    profile_id = ?,
-                    file_path = ?
-                WHERE setup_id = ?
-            """, (
+            cursor.execute(_SQL_UPDATE_SETUP, (
                 setup.name,
                 setup.car_id,
                 setup.track_id,
@@ -346,12 +606,7 @@ class SetupRepository:
             setup_id = setup.setup_id
         else:
             # Insert new
-            cursor.execute("""
-                INSERT INTO setups 
-                (name, car_id, track_id, behavior, sections_json,
-                 created_at, notes, ai_score, ai_confidence, profile_id, file_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_SETUP, (
                 setup.name,
                 setup.car_id,
                 setup.track_id,
@@ -366,74 +621,121 @@ class SetupRepository:
             ))
             setup_id = cursor.lastrowid
         
-        conn.commit()
         return setup_id
     
     def get_setup(self, setup_id: int) -> Optional[Setup]:
         """Get a setup by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_SETUP, (setup_id,))
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            return self._row_to_setup(row)
+    
+    def get_setup_value(self, setup_id: int, section: str, key: str, default: Any = None) -> Any:
+        """
+        Get a single stored setup value without loading the whole setup.
         
-        cursor.execute("SELECT * FROM setups WHERE setup_id = ?", (setup_id,))
-        row = cursor.fetchone()
+        The value is extracted inside SQLite with json_extract, so
+        sections_json is never decoded in Python.
         
-        if not row:
-            return None
+        Args:
+            setup_id: Setup to read from
+            section: Section name (e.g., "TYRES")
+            key: Value key within the section (e.g., "PRESSURE_LF")
+            default: Returned when the setup or value does not exist
+            
+        Returns:
+            The stored value, or default
+        """
+        path = f'$."{section}"."{key}"'
         
-        return self._row_to_setup(row)
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_SETUP_VALUE, (path, setup_id))
+            row = cursor.fetchone()
+            
+            if not row or row[0] is None:
+                return default
+            
+            return row[0]
     
     def get_setups_for_car_track(self, car_id: str, track_id: str) -> list[Setup]:
         """Get all setups for a car/track combination."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT * FROM setups WHERE car_id = ? AND track_id = ? ORDER BY created_at DESC",
-            (car_id, track_id)
-        )
-        rows = cursor.fetchall()
-        
-        return [self._row_to_setup(row) for row in rows]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_SETUPS_FOR_CAR_TRACK, (car_id, track_id))
+            rows = cursor.fetchall()
+            
+            return [self._row_to_setup(row) for row in rows]
     
     def get_recent_setups(self, limit: int = 10) -> list[Setup]:
         """Get most recent setups."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT * FROM setups ORDER BY created_at DESC LIMIT ?",
-            (limit,)
-        )
-        rows = cursor.fetchall()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_RECENT_SETUPS, (limit,))
+            rows = cursor.fetchall()
+            
+            return [self._row_to_setup(row) for row in rows]
+    
+    def get_setup_summaries(self, limit: int = 10) -> list[SetupSummary]:
+        """
+        Get most recent setups for list views.
         
-        return [self._row_to_setup(row) for row in rows]
+        Skips sections_json and the other detail columns; use get_setup()
+        to load the full setup once one is selected.
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_SETUP_SUMMARIES, (limit,))
+            rows = cursor.fetchall()
+            
+            return [
+                SetupSummary(
+                    setup_id, name, car_id, track_id, behavior,
+                    datetime.fromisoformat(created_at) if created_at else None,
+                    ai_score
+                )
+                for setup_id, name, car_id, track_id, behavior, created_at, ai_score in rows
+            ]
     
     def delete_setup(self, setup_id: int) -> bool:
         """Delete a setup."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        cursor.execute("DELETE FROM setups WHERE setup_id = ?", (setup_id,))
+        cursor.execute(_SQL_DELETE_SETUP, (setup_id,))
         conn.commit()
         
         return cursor.rowcount > 0
     
     def _row_to_setup(self, row: sqlite3.Row) -> Setup:
-        """Convert a database row to a Setup."""
+        """Convert a database row (_SETUP_COLUMNS order) to a Setup."""
+        (setup_id, name, car_id, track_id, behavior, sections_json,
+         created_at, notes, ai_score, ai_confidence) = row
+        
         # Parse sections JSON
-        sections_dict = json.loads(row["sections_json"]) if row["sections_json"] else {}
+        sections_dict = _decode_json(sections_json) if sections_json else {}
         
         setup_data = {
-            "setup_id": row["setup_id"],
-            "name": row["name"],
-            "car_id": row["car_id"],
-            "track_id": row["track_id"],
-            "behavior": row["behavior"],
+            "setup_id": setup_id,
+            "name": name,
+            "car_id": car_id,
+            "track_id": track_id,
+            "behavior": behavior,
             "sections": sections_dict,
-            "created_at": row["created_at"],
-            "notes": row["notes"],
-            "ai_score": row["ai_score"],
-            "ai_confidence": row["ai_confidence"]
+            "created_at": created_at,
+            "notes": notes,
+            "ai_score": ai_score,
+            "ai_confidence": ai_confidence
         }
         
         return Setup.from_dict(setup_data)
@@ -444,17 +746,34 @@ class SetupRepository:
     
     def save_feedback(self, feedback: FeedbackEntry) -> int:
         """Save feedback entry."""
-        conn = self._get_connection()
+        conn = self._get_writer()
+        cursor = conn.cursor()
+        
+        feedback_id = self._insert_feedback(cursor, feedback)
+        
+        conn.commit()
+        return feedback_id
+    
+    def save_feedback_bulk(self, entries: list[FeedbackEntry]) -> list[int]:
+        """
+        Save several feedback entries in a single transaction.
+        Returns the feedback IDs in input order.
+        
+        Rows store each entry's own created_at, so the batch makes no
+        per-row clock reads.
+        """
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        issues_json = json.dumps(feedback.issues)
+        # One commit for the whole batch (rolled back on error)
+        with conn:
+            return [self._insert_feedback(cursor, feedback) for feedback in entries]
+    
+    def _insert_feedback(self, cursor: sqlite3.Cursor, feedback: FeedbackEntry) -> int:
+        """Insert a feedback row without committing. Returns the feedback ID."""
+        issues_json = _encode_json(feedback.issues)
         
-        cursor.execute("""
-            INSERT INTO feedback 
-            (setup_id, profile_id, feedback_type, rating, issues_json,
-             comments, behavior, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_SQL_INSERT_FEEDBACK, (
             feedback.setup_id,
             feedback.profile_id,
             feedback.feedback_type,
@@ -465,36 +784,35 @@ class SetupRepository:
             feedback.created_at.isoformat()
         ))
         
-        conn.commit()
         return cursor.lastrowid
     
     def get_feedback_for_profile(self, profile_id: int) -> list[FeedbackEntry]:
         """Get all feedback for a profile."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT * FROM feedback WHERE profile_id = ? ORDER BY created_at DESC",
-            (profile_id,)
-        )
-        rows = cursor.fetchall()
-        
-        return [self._row_to_feedback(row) for row in rows]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_FEEDBACK_FOR_PROFILE, (profile_id,))
+            rows = cursor.fetchall()
+            
+            return [self._row_to_feedback(row) for row in rows]
     
     def _row_to_feedback(self, row: sqlite3.Row) -> FeedbackEntry:
-        """Convert a database row to a FeedbackEntry."""
-        issues = json.loads(row["issues_json"]) if row["issues_json"] else []
+        """Convert a database row (_FEEDBACK_COLUMNS order) to a FeedbackEntry."""
+        (feedback_id, setup_id, profile_id, feedback_type, rating,
+         issues_json, comments, behavior, created_at) = row
+        
+        issues = _decode_json(issues_json) if issues_json else []
         
         return FeedbackEntry(
-            feedback_id=row["feedback_id"],
-            setup_id=row["setup_id"],
-            profile_id=row["profile_id"],
-            feedback_type=row["feedback_type"],
-            rating=row["rating"],
+            feedback_id=feedback_id,
+            setup_id=setup_id,
+            profile_id=profile_id,
+            feedback_type=feedback_type,
+            rating=rating,
             issues=issues,
-            comments=row["comments"],
-            behavior=row["behavior"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now()
+            comments=comments,
+            behavior=behavior,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now()
         )
     
     # ═══════════════════════════════════════════════════════════════
@@ -503,33 +821,30 @@ class SetupRepository:
     
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a setting value."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        
-        if row:
-            return row["value"]
-        return default
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_GET_SETTING, (key,))
+            row = cursor.fetchone()
+            
+            if row:
+                return row["value"]
+            return default
     
     def set_setting(self, key: str, value: str) -> None:
         """Set a setting value."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        cursor.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-            (key, value)
-        )
+        cursor.execute(_SQL_SET_SETTING, (key, value))
         conn.commit()
     
     def delete_setting(self, key: str) -> bool:
         """Delete a setting."""
-        conn = self._get_connection()
+        conn = self._get_writer()
         cursor = conn.cursor()
         
-        cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
+        cursor.execute(_SQL_DELETE_SETTING, (key,))
         conn.commit()
         
         return cursor.rowcount > 0
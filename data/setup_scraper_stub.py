@@ -10,6 +10,9 @@ Future implementation could include:
 - Aggregating anonymous telemetry data
 """
 
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
@@ -19,7 +22,15 @@ from models.car import Car
 from models.track import Track
 
 
-@dataclass
+# Upper bound on threads reading setup files during a directory import
+_IMPORT_WORKERS = 8
+
+# Sections every imported setup must have, in the order issues are reported
+_REQUIRED_SECTIONS: tuple[str, ...] = ("TYRES", "BRAKES", "SUSPENSION", "DIFFERENTIAL")
+_REQUIRED_SECTION_SET: frozenset[str] = frozenset(_REQUIRED_SECTIONS)
+
+
+@dataclass(frozen=True, slots=True)
 class SetupSource:
     """Represents a source of setup data."""
     
@@ -38,12 +49,12 @@ class SetupScraperStub:
     
     def __init__(self):
         """Initialize scraper stub."""
-        self._sources: list[SetupSource] = []
+        self._sources: tuple[SetupSource, ...] = ()
         self._initialize_sources()
     
     def _initialize_sources(self) -> None:
         """Define available data sources (all disabled in stub)."""
-        self._sources = [
+        self._sources = (
             SetupSource(
                 source_id="local_files",
                 name="Local Setup Files",
@@ -65,15 +76,15 @@ class SetupScraperStub:
                 is_available=False,
                 description="Learn from driving telemetry (future feature)"
             )
-        ]
+        )
     
     def get_available_sources(self) -> list[SetupSource]:
         """Get list of available data sources."""
         return [s for s in self._sources if s.is_available]
     
-    def get_all_sources(self) -> list[SetupSource]:
-        """Get list of all data sources."""
-        return self._sources.copy()
+    def get_all_sources(self) -> tuple[SetupSource, ...]:
+        """Get all data sources (shared immutable tuple, no copy needed)."""
+        return self._sources
     
     def import_from_file(self, file_path: Path) -> Optional[Setup]:
         """
@@ -107,16 +118,31 @@ class SetupScraperStub:
         Returns:
             List of imported Setup objects
         """
-        if not directory.exists() or not directory.is_dir():
+        # scandir yields file type with each entry, so filtering needs no
+        # extra stat() calls; entries are already known to exist
+        try:
+            with os.scandir(directory) as entries:
+                paths = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith(".ini") and entry.is_file()
+                ]
+        except OSError:
+            # Missing directory or not a directory
             return []
         
-        setups = []
-        for file_path in directory.glob("*.ini"):
-            setup = self.import_from_file(file_path)
-            if setup:
-                setups.append(setup)
+        from assetto.setup_writer import SetupWriter
+        writer = SetupWriter()
+        
+        # Reading is I/O bound and read_setup keeps no shared state, so
+        # larger folders are read in parallel; map() keeps directory order
+        if len(paths) > 1:
+            workers = min(_IMPORT_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="setup_import") as pool:
+                results = list(pool.map(writer.read_setup, paths))
+        else:
+            results = [writer.read_setup(file_path) for file_path in paths]
         
-        return setups
+        return [setup for setup in results if setup]
     
     def fetch_community_setups(
         self,
@@ -151,11 +177,13 @@ class SetupScraperStub:
         """
         issues = []
         
-        # Check for required sections
-        required_sections = ["TYRES", "BRAKES", "SUSPENSION", "DIFFERENTIAL"]
-        for section in required_sections:
-            if section not in setup.sections:
-                issues.append(f"Missing section: {section}")
+        # Check for required sections (reported in canonical order)
+        missing = _REQUIRED_SECTION_SET - setup.sections.keys()
+        if missing:
+            issues.extend(
+                f"Missing section: {section}"
+                for section in _REQUIRED_SECTIONS if section in missing
+            )
         
         # Check for reasonable values
         if setup.sections.get("BRAKES"):
@@ -186,14 +214,21 @@ class SetupScraperStub:
             "avg_ai_score": 0.0
         }
         
-        # Count behaviors
+        # Count behaviors and accumulate AI scores in one pass
+        behaviors: Counter[str] = Counter()
+        score_sum = 0.0
+        score_count = 0
         for setup in setups:
-            behavior = setup.behavior or "unknown"
-            stats["behaviors"][behavior] = stats["behaviors"].get(behavior, 0) + 1
+            behaviors[setup.behavior or "unknown"] += 1
+            
+            if setup.ai_score > 0:
+                score_sum += setup.ai_score
+                score_count += 1
+        
+        stats["behaviors"] = dict(behaviors)
         
         # Average AI score
-        scores = [s.ai_score for s in setups if s.ai_score > 0]
-        if scores:
-            stats["avg_ai_score"] = sum(scores) / len(scores)
+        if score_count:
+            stats["avg_ai_score"] = score_sum / score_count
         
         return stats
@@ -2,13 +2,15 @@
 Debug script to check what's being read from AC shared memory.
 """
 
+import argparse
 import sys
+import time
 sys.path.insert(0, '.')
 
 from assetto.ac_shared_memory import ACSharedMemory, SPageFileStatic
 import ctypes
 
-def debug_shared_memory():
+def debug_shared_memory(loops: int = 1, interval: float = 1.0):
     """Debug shared memory reading."""
     print("=" * 60)
     print("AC SHARED MEMORY DEBUG")
@@ -22,8 +24,23 @@ def debug_shared_memory():
         return
     
     print("✅ Connected to AC shared memory")
-    print()
     
+    # Map the shared memory once and only re-read it on each loop
+    try:
+        for i in range(loops):
+            if i:
+                time.sleep(interval)
+            print()
+            print_shared_memory(sm)
+    finally:
+        sm.disconnect()
+    
+    print()
+    print("Done!")
+
+
+def print_shared_memory(sm: ACSharedMemory):
+    """Print static, live and raw shared memory contents."""
     # Read static data
     static = sm.read_static()
     if static:
@@ -70,12 +87,12 @@ def debug_shared_memory():
     # Try to read raw bytes to see what's there
     if sm._static_view:
         print()
-        print("Raw memory at carModel offset:")
-        # carModel starts after smVersion(15*2) + acVersion(15*2) + numberOfSessions(4) + numCars(4)
-        # = 30 + 30 + 4 + 4 = 68 bytes
-        offset = 68
+        # Offset and size come from the ctypes field descriptor, so they
+        # follow the structure definition instead of a hand-summed layout
+        car_model = SPageFileStatic.carModel
+        print(f"Raw memory at carModel offset ({car_model.offset}, {car_model.size} bytes):")
         try:
-            raw_bytes = ctypes.string_at(sm._static_view + offset, 66)  # 33 wchars = 66 bytes
+            raw_bytes = ctypes.string_at(sm._static_view + car_model.offset, car_model.size)
             print(f"  Bytes: {raw_bytes[:40]}...")
             # Decode as UTF-16
             try:
@@ -85,11 +102,13 @@ def debug_shared_memory():
                 print("  Could not decode as UTF-16")
         except Exception as e:
             print(f"  Error reading raw: {e}")
-    
-    sm.disconnect()
-    print()
-    print("Done!")
 
 
 if __name__ == "__main__":
-    debug_shared_memory()
+    parser = argparse.ArgumentParser(description="Debug AC shared memory reading")
+    parser.add_argument("--loop", type=int, default=1, metavar="N",
+                        help="read N times over one shared memory connection")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="SEC",
+                        help="pause between reads when looping (default: 1.0)")
+    args = parser.parse_args()
+    debug_shared_memory(args.loop, args.interval)
@@ -2,12 +2,14 @@
 Debug track selection issue.
 """
 
+import argparse
 import sys
+import time
 sys.path.insert(0, '.')
 
 from assetto.ac_shared_memory import ACSharedMemory
 
-def debug_track():
+def debug_track(loops: int = 1, interval: float = 1.0):
     """Debug track detection."""
     print("=" * 60)
     print("DEBUG: Track Selection Issue")
@@ -19,6 +21,18 @@ def debug_track():
         print("❌ Cannot connect to AC")
         return
     
+    # Map the shared memory once and only re-read it on each loop
+    try:
+        for i in range(loops):
+            if i:
+                time.sleep(interval)
+            print_track_info(sm)
+    finally:
+        sm.disconnect()
+
+
+def print_track_info(sm: ACSharedMemory):
+    """Print the car/track identification read from shared memory."""
     live = sm.get_live_data()
     
     print(f"\nDetected from AC:")
@@ -34,9 +48,13 @@ def debug_track():
     print(f"  Track ID: {live.track}")
     print(f"  Track Config: {live.track_config}")
     print(f"  Full ID would be: {live.track}_{live.track_config}" if live.track_config else f"  Full ID: {live.track}")
-    
-    sm.disconnect()
 
 
 if __name__ == "__main__":
-    debug_track()
+    parser = argparse.ArgumentParser(description="Debug AC track detection")
+    parser.add_argument("--loop", type=int, default=1, metavar="N",
+                        help="read N times over one shared memory connection")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="SEC",
+                        help="pause between reads when looping (default: 1.0)")
+    args = parser.parse_args()
+    debug_track(args.loop, args.interval)
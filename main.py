@@ -6,22 +6,25 @@ Main entry point for the application.
 import sys
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from ui.main_window import MainWindow
-from ui.initial_d_style import apply_initial_d_style
-from data.setup_repository import SetupRepository
-from assetto.ac_detector import ACDetector, ACInstallation
-from config.user_settings import get_user_settings
+# Qt and the UI are imported inside main(), so importing this module (or
+# running a non-GUI entry point next to it) does not load PySide6.
 
 
 def main():
     """Application entry point."""
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    
+    from ui.main_window import MainWindow
+    from ui.initial_d_style import apply_initial_d_style
+    from data.setup_repository import SetupRepository
+    from assetto.ac_detector import ACDetector, ACInstallation
+    from config.user_settings import get_user_settings
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -35,10 +38,10 @@ def main():
     # Apply Initial D black/red gradient style
     apply_initial_d_style(app)
     
-    # Initialize database
+    # Open database (MainWindow creates/checks the schema on a worker
+    # thread once the window is up, so startup does not wait on SQLite)
     db_path = PROJECT_ROOT / "data" / "database.db"
     repository = SetupRepository(db_path)
-    repository.initialize_database()
     
     # Create detector
     detector = ACDetector()
@@ -50,7 +53,8 @@ def main():
     if saved_game_path and saved_game_path.exists():
         # Pre-configure detector with saved path
         docs_path = Path.home() / "Documents" / "Assetto Corsa"
-        docs_path.mkdir(parents=True, exist_ok=True)
+        if not docs_path.is_dir():
+            docs_path.mkdir(parents=True, exist_ok=True)
         
         detector._installation = ACInstallation(documents_path=docs_path)
         detector._installation.game_path = saved_game_path
@@ -1,8 +1,31 @@
 """Models package - Data structures for the application."""
 
-from .car import Car
-from .track import Track
-from .setup import Setup, SetupSection
-from .driver_profile import DriverProfile
+import importlib
+
+# Submodules are imported on first access (PEP 562), so importing one
+# model, e.g. `from models.car import Car`, does not load the others.
+_LAZY_IMPORTS = {
+    "Car": ".car",
+    "Track": ".track",
+    "Setup": ".setup",
+    "SetupSection": ".setup",
+    "DriverProfile": ".driver_profile",
+}
 
 __all__ = ["Car", "Track", "Setup", "SetupSection", "DriverProfile"]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a re-exported name on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazy names so autocompletion still lists them."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
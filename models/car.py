@@ -2,12 +2,19 @@
 Car model - Represents an Assetto Corsa car.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 from pathlib import Path
 
 
-@dataclass
+# Setup sections every car offers unless told otherwise (shared, immutable)
+_DEFAULT_SECTIONS: tuple[str, ...] = (
+    "TYRES", "BRAKES", "SUSPENSION", "DIFFERENTIAL",
+    "ALIGNMENT", "AERO", "FUEL"
+)
+
+
+@dataclass(slots=True)
 class Car:
     """Represents a car in Assetto Corsa."""
     
@@ -36,10 +43,13 @@ class Car:
     path: Optional[Path] = None
     
     # Available setup sections for this car
-    available_sections: list[str] = field(default_factory=lambda: [
-        "TYRES", "BRAKES", "SUSPENSION", "DIFFERENTIAL", 
-        "ALIGNMENT", "AERO", "FUEL"
-    ])
+    available_sections: tuple[str, ...] = _DEFAULT_SECTIONS
+    
+    # Serialized field order shared by to_tuple/from_tuple and to_dict
+    _FIELDS: ClassVar[tuple[str, ...]] = (
+        "car_id", "name", "brand", "car_class",
+        "drivetrain", "power_hp", "weight_kg", "path"
+    )
     
     def __post_init__(self):
         """Validate car data after initialization."""
@@ -63,18 +73,37 @@ class Car:
         """Check if car has high power output."""
         return self.power_hp >= 300
     
+    def to_tuple(self) -> tuple:
+        """Convert car to a tuple in _FIELDS order (e.g. SQL parameters)."""
+        return (
+            self.car_id,
+            self.name,
+            self.brand,
+            self.car_class,
+            self.drivetrain,
+            self.power_hp,
+            self.weight_kg,
+            str(self.path) if self.path else None
+        )
+    
+    @classmethod
+    def from_tuple(cls, values: tuple) -> "Car":
+        """Create car from a tuple in _FIELDS order."""
+        car_id, name, brand, car_class, drivetrain, power_hp, weight_kg, path = values
+        return cls(
+            car_id=car_id,
+            name=name,
+            brand=brand,
+            car_class=car_class,
+            drivetrain=drivetrain,
+            power_hp=power_hp,
+            weight_kg=weight_kg,
+            path=Path(path) if path else None
+        )
+    
     def to_dict(self) -> dict:
         """Convert car to dictionary."""
-        return {
-            "car_id": self.car_id,
-            "name": self.name,
-            "brand": self.brand,
-            "car_class": self.car_class,
-            "drivetrain": self.drivetrain,
-            "power_hp": self.power_hp,
-            "weight_kg": self.weight_kg,
-            "path": str(self.path) if self.path else None
-        }
+        return dict(zip(self._FIELDS, self.to_tuple()))
     
     @classmethod
     def from_dict(cls, data: dict) -> "Car":
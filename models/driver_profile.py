@@ -5,6 +5,80 @@ Driver Profile model - Represents driver preferences and style.
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
+from types import MappingProxyType
+
+
+# Experience level -> decision multiplier
+_EXPERIENCE_MULTIPLIERS = MappingProxyType({
+    "beginner": 0.6,
+    "intermediate": 0.8,
+    "advanced": 1.0,
+    "expert": 1.2
+})
+
+# Preset name -> constructor arguments (create_preset builds a fresh
+# profile per call, so callers may mutate what they get back)
+_PRESETS = MappingProxyType({
+    "safe_touge": {
+        "name": "Safe Touge",
+        "stability_rotation": 25.0,
+        "grip_slide": 20.0,
+        "safety_aggression": 20.0,
+        "drift_grip": 80.0,
+        "comfort_performance": 40.0,
+        "preferred_behavior": "safe"
+    },
+    "balanced_touge": {
+        "name": "Balanced Touge",
+        "stability_rotation": 50.0,
+        "grip_slide": 40.0,
+        "safety_aggression": 50.0,
+        "drift_grip": 60.0,
+        "comfort_performance": 50.0,
+        "preferred_behavior": "balanced"
+    },
+    "attack_touge": {
+        "name": "Attack Touge",
+        "stability_rotation": 70.0,
+        "grip_slide": 50.0,
+        "safety_aggression": 75.0,
+        "drift_grip": 55.0,
+        "comfort_performance": 70.0,
+        "preferred_behavior": "attack"
+    },
+    "drift_touge": {
+        "name": "Drift Touge",
+        "stability_rotation": 80.0,
+        "grip_slide": 85.0,
+        "safety_aggression": 60.0,
+        "drift_grip": 15.0,
+        "comfort_performance": 55.0,
+        "preferred_behavior": "drift"
+    }
+})
+
+
+def _clamp_slider(value: float) -> float:
+    """
+    Clamp a slider value to 0-100 without min()/max() calls.
+    
+    Matches max(0.0, min(100.0, value)) exactly, including returning the
+    float bounds for values equal to them and 100.0 for NaN.
+    """
+    if value <= 0.0:
+        return 0.0
+    if not value < 100.0:
+        return 100.0
+    return value
+
+
+def _parse_timestamp(value, default: Optional[datetime]):
+    """ISO string -> datetime; None -> default; anything else as-is."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value is None:
+        return default
+    return value
 
 
 @dataclass
@@ -55,11 +129,11 @@ class DriverProfile:
     
     def _clamp_sliders(self) -> None:
         """Ensure all slider values are within 0-100 range."""
-        self.stability_rotation = max(0.0, min(100.0, self.stability_rotation))
-        self.grip_slide = max(0.0, min(100.0, self.grip_slide))
-        self.safety_aggression = max(0.0, min(100.0, self.safety_aggression))
-        self.drift_grip = max(0.0, min(100.0, self.drift_grip))
-        self.comfort_performance = max(0.0, min(100.0, self.comfort_performance))
+        self.stability_rotation = _clamp_slider(self.stability_rotation)
+        self.grip_slide = _clamp_slider(self.grip_slide)
+        self.safety_aggression = _clamp_slider(self.safety_aggression)
+        self.drift_grip = _clamp_slider(self.drift_grip)
+        self.comfort_performance = _clamp_slider(self.comfort_performance)
     
     # Computed properties for AI decision engine
     
@@ -135,26 +209,27 @@ class DriverProfile:
     
     def get_experience_multiplier(self) -> float:
         """Get multiplier based on experience level."""
-        multipliers = {
-            "beginner": 0.6,
-            "intermediate": 0.8,
-            "advanced": 1.0,
-            "expert": 1.2
-        }
-        return multipliers.get(self.experience_level, 0.8)
+        return _EXPERIENCE_MULTIPLIERS.get(self.experience_level, 0.8)
     
     def get_all_factors(self) -> dict[str, float]:
         """Get all preference factors as a dictionary."""
+        # Same formulas as the *_factor properties, from one read per slider
+        # (sliders are plain fields the UI reassigns, so nothing is cached)
+        rotation = self.stability_rotation / 100.0
+        slide = self.grip_slide / 100.0
+        aggression = self.safety_aggression / 100.0
+        performance = self.comfort_performance / 100.0
+        
         return {
-            "stability": self.stability_factor,
-            "rotation": self.rotation_factor,
-            "grip": self.grip_factor,
-            "slide": self.slide_factor,
-            "safety": self.safety_factor,
-            "aggression": self.aggression_factor,
-            "drift": self.drift_factor,
-            "performance": self.performance_factor,
-            "comfort": self.comfort_factor,
+            "stability": 1.0 - rotation,
+            "rotation": rotation,
+            "grip": 1.0 - slide,
+            "slide": slide,
+            "safety": 1.0 - aggression,
+            "aggression": aggression,
+            "drift": 1.0 - (self.drift_grip / 100.0),
+            "performance": performance,
+            "comfort": 1.0 - performance,
             "experience": self.get_experience_multiplier()
         }
     
@@ -178,16 +253,12 @@ class DriverProfile:
     def from_dict(cls, data: dict) -> "DriverProfile":
         """Create profile from dictionary."""
         created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-        
         last_used = data.get("last_used")
-        if isinstance(last_used, str):
-            last_used = datetime.fromisoformat(last_used)
-        elif last_used is None:
-            last_used = datetime.now()
+        
+        # Read the clock once, and only if a timestamp is missing
+        now = datetime.now() if created_at is None or last_used is None else None
+        created_at = _parse_timestamp(created_at, now)
+        last_used = _parse_timestamp(last_used, now)
         
         return cls(
             profile_id=data.get("profile_id"),
@@ -206,42 +277,7 @@ class DriverProfile:
     @classmethod
     def create_preset(cls, preset_name: str) -> "DriverProfile":
         """Create a preset driver profile."""
-        presets = {
-            "safe_touge": cls(
-                name="Safe Touge",
-                stability_rotation=25.0,
-                grip_slide=20.0,
-                safety_aggression=20.0,
-                drift_grip=80.0,
-                comfort_performance=40.0,
-                preferred_behavior="safe"
-            ),
-            "balanced_touge": cls(
-                name="Balanced Touge",
-                stability_rotation=50.0,
-                grip_slide=40.0,
-                safety_aggression=50.0,
-                drift_grip=60.0,
-                comfort_performance=50.0,
-                preferred_behavior="balanced"
-            ),
-            "attack_touge": cls(
-                name="Attack Touge",
-                stability_rotation=70.0,
-                grip_slide=50.0,
-                safety_aggression=75.0,
-                drift_grip=55.0,
-                comfort_performance=70.0,
-                preferred_behavior="attack"
-            ),
-            "drift_touge": cls(
-                name="Drift Touge",
-                stability_rotation=80.0,
-                grip_slide=85.0,
-                safety_aggression=60.0,
-                drift_grip=15.0,
-                comfort_performance=55.0,
-                preferred_behavior="drift"
-            )
-        }
-        return presets.get(preset_name, cls())
+        kwargs = _PRESETS.get(preset_name)
+        if kwargs is None:
+            return cls()
+        return cls(**kwargs)
@@ -3,7 +3,7 @@ Setup model - Represents an Assetto Corsa car setup.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 from datetime import datetime
 
 
@@ -135,11 +135,29 @@ class Setup:
         self.sections[section].set(key, value)
     
     def get_value(self, section: str, key: str, default: Any = None) -> Any:
-        """Get a value from a specific section."""
+        """
+        Get a value from a specific section.
+        
+        Returns default when the section or key is missing; callers that
+        probe for presence rely on the default None as the miss marker.
+        """
         if section not in self.sections:
             return default
         return self.sections[section].get(key, default)
     
+    def get_values(self, section: str, keys: Sequence[str], default: Any = None) -> list[Any]:
+        """Get several values from one section, in key order."""
+        if section not in self.sections:
+            return [default] * len(keys)
+        values = self.sections[section].values
+        return [values.get(key, default) for key in keys]
+    
+    def set_values(self, section: str, values: dict[str, Any]) -> None:
+        """Set several values in one section."""
+        if section not in self.sections:
+            self.sections[section] = SetupSection(section)
+        self.sections[section].values.update(values)
+    
     def has_value(self, section: str, key: str) -> bool:
         """Check if a value exists in a specific section."""
         if section not in self.sections:
@@ -5,9 +5,23 @@ Track model - Represents an Assetto Corsa track.
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
+from types import MappingProxyType
 
 
-@dataclass
+# Characteristics given to tracks created without any (touge defaults);
+# each Track gets its own copy
+_DEFAULT_TOUGE_CHARACTERISTICS = MappingProxyType({
+    "requires_stability": True,
+    "requires_rotation": True,
+    "tight_corners": True,
+    "elevation_changes": True,
+    "grip_priority": 0.7,
+    "rotation_priority": 0.6,
+    "stability_priority": 0.8
+})
+
+
+@dataclass(slots=True)
 class Track:
     """Represents a track in Assetto Corsa."""
     
@@ -44,6 +58,9 @@ class Track:
     # Track characteristics for AI
     characteristics: dict = field(default_factory=dict)
     
+    # Corner density, derived once from corners/length_m in __post_init__
+    _corners_per_km: float = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate track data after initialization."""
         if not self.track_id:
@@ -53,19 +70,13 @@ class Track:
         
         # Set default characteristics for touge
         if not self.characteristics:
-            self.characteristics = self._default_touge_characteristics()
-    
-    def _default_touge_characteristics(self) -> dict:
-        """Default characteristics for touge tracks."""
-        return {
-            "requires_stability": True,
-            "requires_rotation": True,
-            "tight_corners": True,
-            "elevation_changes": True,
-            "grip_priority": 0.7,
-            "rotation_priority": 0.6,
-            "stability_priority": 0.8
-        }
+            self.characteristics = _DEFAULT_TOUGE_CHARACTERISTICS.copy()
+        
+        # Unknown length counts as infinitely dense, i.e. technical
+        if self.length_m > 0:
+            self._corners_per_km = (self.corners / self.length_m) * 1000
+        else:
+            self._corners_per_km = float("inf")
     
     @property
     def full_id(self) -> str:
@@ -80,10 +91,7 @@ class Track:
     
     def is_technical(self) -> bool:
         """Check if track is technical (many tight corners)."""
-        if self.length_m <= 0:
-            return True  # Assume technical for unknown tracks
-        corners_per_km = (self.corners / self.length_m) * 1000
-        return corners_per_km > 15
+        return self._corners_per_km > 15
     
     def has_elevation(self) -> bool:
         """Check if track has significant elevation changes."""
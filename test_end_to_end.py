@@ -211,6 +211,116 @@ def test_slider_effects():
         return False
 
 
+def test_neutral_sliders():
+    """Test that a neutral slider profile is detected and changes nothing."""
+    print("\n" + "=" * 60)
+    print("TEST: Neutral Slider Profile")
+    print("=" * 60)
+    
+    from core.slider_interdependencies import SliderInterdependencyEngine, NEUTRAL_SLIDER_VALUES
+    
+    engine = SliderInterdependencyEngine()
+    
+    setup = Setup()
+    setup.set_value("DIFFERENTIAL", "POWER", 50)
+    setup.set_value("ALIGNMENT", "CAMBER_LF", -30)
+    
+    neutral = dict(NEUTRAL_SLIDER_VALUES)
+    _, changes = engine.apply_all_sliders(setup, neutral, is_click_based=True)
+    
+    # Missing aggression/performance/aero default to 0.5, which is not neutral
+    if not engine.is_neutral_profile(neutral) or changes:
+        print(f"  ❌ Neutral profile produced {len(changes)} changes")
+        return False
+    if engine.is_neutral_profile({}):
+        print(f"  ❌ Empty profile treated as neutral")
+        return False
+    
+    # Float noise around the neutral value must not trigger the effect walk
+    _, changes = engine.apply_slider(setup, "rotation", 0.5 + 1e-9, is_click_based=True)
+    if changes:
+        print(f"  ❌ Near-neutral slider produced {len(changes)} changes")
+        return False
+    
+    print(f"  ✅ Neutral profile detected, no changes applied")
+    return True
+
+
+def test_batch_generation():
+    """Test that batch generation matches one-by-one generation."""
+    print("\n" + "=" * 60)
+    print("TEST: Batch Setup Generation")
+    print("=" * 60)
+    
+    from core.setup_engine_v2 import SetupEngineV2
+    
+    engine = SetupEngineV2()
+    car = Car(car_id="ks_nissan_gtr", name="Nissan GT-R", power_hp=550, weight_kg=1750, drivetrain="AWD")
+    track = Track(track_id="spa", name="Spa")
+    profile = DriverProfile(stability_rotation=80.0, safety_aggression=80.0)
+    
+    behaviors = ["safe", "balanced", "attack"]
+    ambient_temps = [10.0, 25.0, 10.0]
+    road_temps = [12.0, 30.0, 12.0]
+    
+    batch = engine.generate_setups(car, track, behaviors, ambient_temps, road_temps, profile=profile)
+    
+    all_match = len(batch) == len(behaviors)
+    for setup, behavior, ambient, road in zip(batch, behaviors, ambient_temps, road_temps):
+        single = engine.generate_setup(car, track, behavior, profile, ambient, road)
+        if setup.sections == single.sections and setup.behavior == behavior:
+            print(f"  ✅ {behavior} @ {ambient}°C/{road}°C")
+        else:
+            print(f"  ❌ {behavior} @ {ambient}°C/{road}°C differs from single generation")
+            all_match = False
+    
+    return all_match
+
+
+def test_fused_sliders():
+    """Test that the fused profile pass matches applying sliders one by one."""
+    print("\n" + "=" * 60)
+    print("TEST: Fused Slider Profile")
+    print("=" * 60)
+    
+    from core.slider_interdependencies import SliderInterdependencyEngine
+    
+    engine = SliderInterdependencyEngine()
+    
+    profile = {
+        "rotation": 0.8,
+        "slide": 0.3,
+        "aggression": 0.9,
+        "drift": 0.6,
+        "performance": 0.7,
+        "aero": 0.4,
+    }
+    
+    for is_click_based in (False, True):
+        sequential = Setup()
+        fused = Setup()
+        for setup in (sequential, fused):
+            # Only the alternative wing key exists
+            del setup.sections["AERO"].values["WING_REAR"]
+            setup.set_value("AERO", "WING_1", 5)
+        
+        engine.apply_all_sliders(sequential, profile, is_click_based, record_changes=False)
+        engine.apply_profile_fused(fused, profile, is_click_based)
+        
+        for name, section in sequential.sections.items():
+            for key, expected in section.values.items():
+                actual = fused.get_value(name, key)
+                if actual is None or abs(actual - expected) > 1e-9:
+                    print(f"  ❌ {name}/{key}: fused {actual} != sequential {expected}")
+                    return False
+        if fused.to_dict()["sections"].keys() != sequential.to_dict()["sections"].keys():
+            print(f"  ❌ Fused pass created different sections")
+            return False
+    
+    print(f"  ✅ Fused profile matches sequential slider application")
+    return True
+
+
 def run_all_tests():
     """Run all end-to-end tests."""
     print("=" * 60)
@@ -223,6 +333,9 @@ def run_all_tests():
     results.append(("Category Classification", test_category_classification()))
     results.append(("Track Type Detection", test_track_type_detection()))
     results.append(("Slider Effects", test_slider_effects()))
+    results.append(("Neutral Sliders", test_neutral_sliders()))
+    results.append(("Fused Sliders", test_fused_sliders()))
+    results.append(("Batch Generation", test_batch_generation()))
     
     print("\n" + "=" * 60)
     print("END-TO-END TEST SUMMARY")
@@ -304,6 +304,130 @@ def test_value_ranges():
     return all_valid
 
 
+def test_existing_setup_read():
+    """Test reading reference values from an existing setup file."""
+    print("\n" + "=" * 60)
+    print("TEST 6: Existing Setup Read")
+    print("=" * 60)
+    
+    import os
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        generic = base / "ks_toyota_ae86" / "generic"
+        generic.mkdir(parents=True)
+        last_ini = generic / "last.ini"
+        last_ini.write_text(
+            "[PRESSURE_LF]\nVALUE=26\n\n[CAMBER_LF]\nVALUE=-30\n\n[CAR]\nMODEL=ks_toyota_ae86\n",
+            encoding="utf-8"
+        )
+        
+        writer = SetupWriterV2(base)
+        first = writer._read_existing_setup("ks_toyota_ae86")
+        second = writer._read_existing_setup("ks_toyota_ae86")
+        
+        # Rewriting the file must invalidate the cached values
+        last_ini.write_text("[PRESSURE_LF]\nVALUE=28\n", encoding="utf-8")
+        stat = last_ini.stat()
+        os.utime(last_ini, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = writer._read_existing_setup("ks_toyota_ae86")
+    
+    expected = {"PRESSURE_LF": 26, "CAMBER_LF": -30}
+    if first != expected or second != expected:
+        print(f"❌ Unexpected values: {first} / {second}")
+        return False
+    if third != {"PRESSURE_LF": 28}:
+        print(f"❌ Stale values after rewrite: {third}")
+        return False
+    
+    print("✅ Existing setup values read and refreshed correctly")
+    return True
+
+
+def test_unchanged_rewrite():
+    """Test that rewriting identical values skips the file writes."""
+    print("\n" + "=" * 60)
+    print("TEST 7: Unchanged Rewrite")
+    print("=" * 60)
+    
+    import shutil
+    import tempfile
+    
+    setup = Setup()
+    setup.name = "Rewrite Test"
+    setup.set_value("TYRES", "PRESSURE_LF", 26)
+    setup.set_value("DIFFERENTIAL", "POWER", 40)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = SetupWriterV2(Path(tmp))
+        writer.enable_debug_logging = False
+        
+        ok1, msg1, path1 = writer.write_setup(setup, "ks_toyota_ae86", "spa", overwrite=True)
+        ok2, msg2, path2 = writer.write_setup(setup, "ks_toyota_ae86", "spa", overwrite=True)
+        
+        # A removed copy (and its folder) must be written again
+        shutil.rmtree(path1.parent)
+        ok3, msg3, path3 = writer.write_setup(setup, "ks_toyota_ae86", "spa", overwrite=True)
+        restored = path3.exists()
+        
+        # A new base path must get its own copies, not an "unchanged" skip
+        with tempfile.TemporaryDirectory() as tmp2:
+            writer.set_base_path(Path(tmp2))
+            ok4, msg4, path4 = writer.write_setup(setup, "ks_toyota_ae86", "spa", overwrite=True)
+            moved = path4 is not None and path4.is_relative_to(tmp2) and path4.exists()
+            
+            # Without overwrite the generic copy is still rewritten (no skip)
+            ok5, msg5, path5 = writer.write_setup(setup, "ks_toyota_ae86", "spa")
+            kept_generic = path5 is not None and path5.parent.name == "generic"
+    
+    if not (ok1 and ok2 and ok3 and ok4) or path1 != path2 or path2 != path3:
+        print(f"❌ Unexpected results: {msg1} / {msg2} / {msg3} / {msg4}")
+        return False
+    if "unchanged" not in msg2 or "unchanged" in msg3 or not restored:
+        print(f"❌ Skip logic wrong: {msg2} / {msg3}")
+        return False
+    if "unchanged" in msg4 or not moved:
+        print(f"❌ Base path change not written: {msg4}")
+        return False
+    
+    if not ok5 or "unchanged" in msg5 or not kept_generic:
+        print(f"❌ overwrite=False should save to generic: {msg5}")
+        return False
+    
+    print("✅ Identical rewrite skipped, removed folder, file and new base path rewritten")
+    return True
+
+
+def test_debug_log_flushed_on_close():
+    """Test that close() writes debug logs still queued on the I/O thread."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Debug Log Flushed On Close")
+    print("=" * 60)
+    
+    import tempfile
+    
+    setup = Setup()
+    setup.name = "Close Test"
+    setup.set_value("TYRES", "PRESSURE_LF", 26)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = SetupWriterV2(Path(tmp))
+        writer.enable_debug_logging = True
+        
+        ok, msg, _ = writer.write_setup(setup, "ks_toyota_ae86", "spa", overwrite=True)
+        writer.close()
+        
+        logs = list((Path(tmp) / "ks_toyota_ae86").glob("debug_*.log"))
+    
+    if not ok or len(logs) != 1:
+        print(f"❌ Expected one debug log after close(): {msg} / {logs}")
+        return False
+    
+    print("✅ Debug log on disk once close() returns")
+    return True
+
+
 def run_all_tests():
     """Run all setup export tests."""
     print("=" * 60)
@@ -317,6 +441,9 @@ def run_all_tests():
     results.append(("INI Format", test_ini_format()))
     results.append(("AC Parameter Names", test_ac_parameter_names()))
     results.append(("Value Ranges", test_value_ranges()))
+    results.append(("Existing Setup Read", test_existing_setup_read()))
+    results.append(("Unchanged Rewrite", test_unchanged_rewrite()))
+    results.append(("Debug Log Flushed On Close", test_debug_log_flushed_on_close()))
     
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
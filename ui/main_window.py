@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QProgressBar, QInputDialog, QFileDialog, QMenuBar, QMenu,
     QTabWidget
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QFont, QColor, QPalette
 
 from typing import Optional
@@ -44,6 +44,30 @@ from config.user_settings import get_user_settings
 import json
 
 
+class _DatabaseInitSignals(QObject):
+    """Signals for _DatabaseInitTask (QRunnable is not a QObject)."""
+    
+    finished = Signal()
+    failed = Signal(str)  # Error message
+
+
+class _DatabaseInitTask(QRunnable):
+    """Creates/checks the database schema on a thread pool worker."""
+    
+    def __init__(self, repository: SetupRepository):
+        super().__init__()
+        self.repository = repository
+        self.signals = _DatabaseInitSignals()
+    
+    def run(self) -> None:
+        try:
+            self.repository.initialize_database()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+
 class MainWindow(QMainWindow):
     """
     Main application window.
@@ -100,6 +124,10 @@ class MainWindow(QMainWindow):
         self._last_sector_index: int = -1
         self._track_map_initialized: bool = False
         self._last_completed_laps: int = 0  # Track lap completion for AI learning
+        self._db_init_task: Optional[_DatabaseInitTask] = None
+        self._database_ready: bool = False
+        self._database_failed: bool = False  # Init failed: run without saving
+        self._ac_initialized: bool = False
         
         # UI setup
         self._setup_window()
@@ -108,7 +136,12 @@ class MainWindow(QMainWindow):
         self._setup_statusbar()
         self._apply_dark_theme()
         
-        # Initialize
+        # Generation waits until the profile is loaded (_finish_initialize)
+        self.generate_btn.setEnabled(False)
+        
+        # Initialize (database on a worker, so the first frame is not
+        # held up by SQLite I/O)
+        QTimer.singleShot(0, self._start_database_init)
         QTimer.singleShot(100, self._initialize)
     
     def _setup_window(self) -> None:
@@ -1061,8 +1094,48 @@ class MainWindow(QMainWindow):
             if result == QMessageBox.Yes:
                 self._on_select_ac_folder()
         
-        # Load profile
-        self._current_profile = self.repository.get_active_profile()
+        # Profile loading and polling wait for the database init outcome
+        self._ac_initialized = True
+        if self._database_ready or self._database_failed:
+            self._finish_initialize()
+    
+    def _start_database_init(self) -> None:
+        """Initialize the database on the global thread pool."""
+        task = _DatabaseInitTask(self.repository)
+        task.setAutoDelete(False)  # Keep it (and its signals) alive here
+        task.signals.finished.connect(self._on_database_ready)
+        task.signals.failed.connect(self._on_database_failed)
+        self._db_init_task = task
+        
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_database_ready(self) -> None:
+        """Enable database-backed features once the schema exists."""
+        self._database_ready = True
+        
+        if self._ac_initialized:
+            self._finish_initialize()
+    
+    def _on_database_failed(self, message: str) -> None:
+        """Report a database initialization failure and continue without it."""
+        self._database_failed = True
+        self.statusbar.showMessage(f"Erreur base de données: {message}")
+        QMessageBox.critical(
+            self,
+            "Erreur",
+            f"La base de données n'a pas pu être initialisée.\n\n{message}\n\n"
+            f"Les setups ne seront pas enregistrés dans l'historique."
+        )
+        
+        # Detection and generation still work, only saving is skipped
+        if self._ac_initialized:
+            self._finish_initialize()
+    
+    def _finish_initialize(self) -> None:
+        """Load the profile and start polling (AC connected, database init done)."""
+        # Load profile (default one if the database is unavailable)
+        if self._database_ready:
+            self._current_profile = self.repository.get_active_profile()
         if self._current_profile:
             self.sliders_panel.set_profile(self._current_profile)
         else:
@@ -1073,6 +1146,9 @@ class MainWindow(QMainWindow):
         
         # Start telemetry polling for live data
         self._start_telemetry_polling()
+        
+        # Generation needs the profile loaded above
+        self.generate_btn.setEnabled(True)
     
     def _on_selection_changed(self, car: Optional[Car], track: Optional[Track]) -> None:
         """Handle car/track selection change."""
@@ -1307,7 +1383,7 @@ class MainWindow(QMainWindow):
                 track_id=track.full_id
             )
             
-            if success:
+            if success and self._database_ready:
                 # Save to database
                 self.repository.save_setup(
                     setup,
@@ -1317,7 +1393,8 @@ class MainWindow(QMainWindow):
                 
                 # Save profile
                 self.repository.save_profile(self._current_profile)
-                
+            
+            if success:
                 QMessageBox.information(
                     self,
                     "Setup généré",
@@ -1575,6 +1652,11 @@ class MainWindow(QMainWindow):
     
     def _on_quick_start_generate(self) -> None:
         """Handle quick start generate button."""
+        # The signal can fire before initialization has loaded the profile
+        if self._current_profile is None:
+            self.statusbar.showMessage("Initialisation en cours...")
+            return
+        
         # Use the auto-detected car and track
         car = self.car_track_selector.get_selected_car()
         track = self.car_track_selector.get_selected_track()
@@ -1664,7 +1746,8 @@ class MainWindow(QMainWindow):
         
         # Save to repository
         self._current_setup = optimized_setup
-        self.repository.save_setup(optimized_setup)
+        if self._database_ready:
+            self.repository.save_setup(optimized_setup)
         
         # Update advisor panel with setup-based advice
         self.advisor_panel.set_setup(optimized_setup)
@@ -1820,11 +1903,18 @@ class MainWindow(QMainWindow):
         # Disconnect shared memory
         self.shared_memory.disconnect()
         
+        # Let a still-running database initialization finish first
+        if not self._database_ready:
+            QThreadPool.globalInstance().waitForDone()
+        
         # Save current profile
-        if self._current_profile:
+        if self._current_profile and self._database_ready:
             self.repository.save_profile(self._current_profile)
         
         # Close database
         self.repository.close()
         
+        # Finish queued setup writes and stop the writer's I/O thread
+        self.setup_engine_v22.writer.close()
+        
         event.accept()
@@ -3,15 +3,21 @@ Car Data Loader - Utility to load enriched car data from JSON.
 Provides physical parameters for V2.1 setup generation.
 """
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 
 def load_car_data(car_id: str) -> Dict:
     """
     Load enriched data for a specific car.
     
+    The parsed data file is cached until its mtime changes; each call
+    returns a fresh copy so callers may modify it freely.
+    
     Args:
         car_id: Car identifier (e.g., "ks_porsche_911_gt3_r_2016")
     
@@ -26,26 +32,42 @@ def load_car_data(car_id: str) -> Dict:
         # Try example file
         json_path = Path(__file__).parent.parent / "data" / "cars_enriched_example.json"
     
-    if not json_path.exists():
-        print(f"[CAR DATA] Enriched data not found at {json_path}")
-        return {}
-    
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Search for car
-        for car in data.get("cars", []):
-            if car.get("car_id") == car_id:
-                print(f"[CAR DATA] Loaded enriched data for {car_id}")
-                return car
-        
-        print(f"[CAR DATA] Car {car_id} not found in enriched data")
+        cars = _load_car_index(json_path, json_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        print(f"[CAR DATA] Enriched data not found at {json_path}")
         return {}
-        
     except Exception as e:
+        # Read/parse failures are not cached, so a fixed file is picked up
         print(f"[CAR DATA] Error loading enriched data: {e}")
         return {}
+    
+    car = cars.get(car_id)
+    if car is None:
+        print(f"[CAR DATA] Car {car_id} not found in enriched data")
+        return {}
+    
+    print(f"[CAR DATA] Loaded enriched data for {car_id}")
+    return copy.deepcopy(car)
+
+
+@lru_cache(maxsize=4)
+def _load_car_index(json_path: Path, mtime_ns: int) -> Mapping[str, Dict]:
+    """
+    Parse the enriched data file into {car_id: entry} (memoized).
+    
+    mtime_ns is part of the cache key so an edited file is re-read.
+    Errors propagate and are therefore never cached.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    cars: Dict[str, Dict] = {}
+    for car in data.get("cars", []):
+        # First entry wins, as with the former linear search
+        cars.setdefault(car.get("car_id"), car)
+    
+    return MappingProxyType(cars)
 
 
 def get_motion_ratios(car_id: str, category: str = "street") -> Dict[str, float]: